@@ -0,0 +1,63 @@
+"""Compare two benchmark result files written by ``benchmarks.run``.
+
+Prints the median time and peak memory ratio (new / old) of every case
+present in both files::
+
+    $ python -m benchmarks.compare main.json branch.json --fail-above 1.25
+
+With ``--fail-above`` the exit status is 1 when any time ratio exceeds the
+threshold, so the comparison can gate a CI job.
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as results_file:
+        results = json.load(results_file)["results"]
+    return {
+        (result["function"], json.dumps(result["params"], sort_keys=True),
+         result["dataset"], result["rows"]): result
+        for result in results
+    }
+
+
+def compare(old, new):
+    """Returns (key, time ratio, memory ratio) for cases in both runs."""
+    rows = []
+    for key in sorted(set(old) & set(new)):
+        time_ratio = new[key]["median_s"] / max(old[key]["median_s"], 1e-9)
+        memory_ratio = new[key]["peak_bytes"] / max(old[key]["peak_bytes"],
+                                                    1)
+        rows.append((key, time_ratio, memory_ratio))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--fail-above", type=float, default=None,
+                        help="exit 1 if a time ratio exceeds this")
+    args = parser.parse_args(argv)
+
+    rows = compare(load(args.old), load(args.new))
+    print("{0:<26} {1:<40} {2:<18} {3:>11} {4:>7} {5:>7}".format(
+        "function", "params", "dataset", "rows", "time", "memory"
+    ))
+    for (function, params, dataset, n_rows), time_ratio, memory_ratio in rows:
+        print("{0:<26} {1:<40} {2:<18} {3:>11,d} {4:>6.2f}x {5:>6.2f}x"
+              .format(function, params, dataset, n_rows, time_ratio,
+                      memory_ratio))
+
+    if args.fail_above is not None:
+        regressions = [row for row in rows if row[1] > args.fail_above]
+        if regressions:
+            print("{0} case(s) slower than {1}x".format(len(regressions),
+                                                        args.fail_above))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Synthetic dataframes for the instaeda benchmarks.
+
+Every generator takes the number of rows and a seed and returns a frame with
+a fixed column layout, so results at different scales are comparable.
+"""
+import numpy as np
+import pandas as pd
+
+# About 1.6 GB of float64 values
+MAX_WIDE_VALUES = 2 * 10 ** 8
+
+
+def tall(rows, seed=0):
+    """A few well-behaved numeric columns with 1% missing values."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "x{0}".format(i): rng.normal(i, 1 + i, rows)
+            for i in range(6)
+        }
+    )
+    df["count"] = rng.poisson(10, rows)
+    return _with_missing(df, ["x0", "x1", "x2"], 0.01, rng)
+
+
+def wide(rows, seed=0, columns=200):
+    """Many correlated float columns, 1% missing values. The number of
+    columns is capped so the frame holds at most MAX_WIDE_VALUES values."""
+    rng = np.random.default_rng(seed)
+    columns = max(min(columns, MAX_WIDE_VALUES // max(rows, 1)), 1)
+    base = rng.normal(size=rows)
+    # Column by column, so no second full-size noise array is allocated
+    df = pd.DataFrame(
+        {
+            "w{0}".format(i): base + rng.normal(size=rows)
+            for i in range(columns)
+        }
+    )
+    return _with_missing(df, list(df.columns[::10]), 0.01, rng)
+
+
+def nan_heavy(rows, seed=0):
+    """Numeric and string columns where half of the values are missing."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(size=rows),
+            "b": rng.uniform(size=rows),
+            "c": rng.integers(0, 100, rows).astype(float),
+            "label": rng.choice(["red", "green", "blue"], rows).astype(
+                object
+            ),
+        }
+    )
+    return _with_missing(df, list(df.columns), 0.5, rng)
+
+
+def high_cardinality(rows, seed=0):
+    """String columns with up to one distinct value per row."""
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, rows, rows)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "score": rng.normal(size=rows),
+            "user": np.char.add("user_", ids.astype(str)).astype(object),
+            "city": np.char.add(
+                "city_", rng.integers(0, max(rows // 100, 1), rows)
+                .astype(str)
+            ).astype(object),
+        }
+    )
+    return _with_missing(df, ["score", "city"], 0.05, rng)
+
+
+def mixed(rows, seed=0):
+    """Floats, ints, bools, datetimes and strings side by side."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "price": rng.lognormal(3, 1, rows),
+            "quantity": rng.integers(1, 50, rows),
+            "discount": rng.uniform(0, 0.5, rows).astype(np.float32),
+            "returned": rng.uniform(size=rows) < 0.1,
+            "ordered": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 10 ** 6, rows), unit="min"),
+            "category": rng.choice(list("ABCDEFGH"), rows).astype(object),
+            "channel": rng.choice(["web", "store", "phone"], rows).astype(
+                object
+            ),
+        }
+    )
+    return _with_missing(df, ["price", "discount", "category"], 0.1, rng)
+
+
+DATASETS = {
+    "tall": tall,
+    "wide": wide,
+    "nan_heavy": nan_heavy,
+    "high_cardinality": high_cardinality,
+    "mixed": mixed,
+}
+
+
+def _with_missing(df, cols, fraction, rng):
+    for col in cols:
+        missing = rng.uniform(size=len(df)) < fraction
+        if df[col].dtype == object:
+            df.loc[missing, col] = None
+        else:
+            df[col] = df[col].where(~missing)
+    return df
@@ -0,0 +1,177 @@
+"""Time and memory-profile the public instaeda functions.
+
+Runs every public function on the synthetic frames of ``benchmarks.datasets``
+at the requested scales and writes the measurements to a JSON file that
+``benchmarks.compare`` can diff against another run::
+
+    $ python -m benchmarks.run --scales 1e3 1e4 1e5 --output bench.json
+    $ python -m benchmarks.run --datasets tall wide --scales 1e6 1e7
+"""
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+import instaeda
+from instaeda import instaeda as eda
+from instaeda.cache import clear_cache
+
+from benchmarks.datasets import DATASETS
+
+
+CORR_METHODS = ["pearson", "spearman", "kendall"]
+FILL_STRATEGIES = ["mean", "median", "constant", "most_frequent"]
+FILL_PARTS = [1, 4, 16]
+
+
+def cases(df, max_kendall_rows):
+    """Yields (function, params, callable) for every benchmarked call."""
+    yield "plot_intro", {}, lambda: eda.plot_intro(df)
+
+    for method in CORR_METHODS:
+        if method == "kendall" and len(df) > max_kendall_rows:
+            continue
+        yield ("plot_corr", {"method": method},
+               lambda method=method: eda.plot_corr(df, method=method))
+        if method != "kendall":
+            yield ("plot_corr", {"method": method, "precision": "float32"},
+                   lambda method=method: eda.plot_corr(
+                       df, method=method, precision="float32"))
+
+    for strategy in FILL_STRATEGIES:
+        for parts in FILL_PARTS:
+            yield (
+                "divide_and_fill",
+                {"strategy": strategy, "parts": parts},
+                lambda strategy=strategy, parts=parts: eda.divide_and_fill(
+                    df, strategy=strategy, parts=parts
+                ),
+            )
+
+    yield ("plot_basic_distributions", {},
+           lambda: eda.plot_basic_distributions(df))
+    yield ("plot_basic_distributions", {"precision": "float32"},
+           lambda: eda.plot_basic_distributions(df, precision="float32"))
+
+
+def measure(func, repeat, spec_max_rows, rows):
+    """Returns wall times over `repeat` cold runs, the peak traced memory of
+    one extra run and the serialized size of the returned chart(s)."""
+    times = []
+    for _ in range(repeat):
+        clear_cache()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # Memory is traced separately as tracemalloc slows the timed code down
+    clear_cache()
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    spec_bytes = None
+    if rows <= spec_max_rows:
+        spec_bytes = spec_size(result)
+
+    return {
+        "times_s": times,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak,
+        "spec_bytes": spec_bytes,
+    }
+
+
+def spec_size(result):
+    """Returns the length of the Vega-Lite JSON of the returned chart(s)."""
+    if isinstance(result, dict):
+        sizes = [spec_size(chart) for chart in result.values()]
+        return sum(size for size in sizes if size is not None)
+    if isinstance(result, alt.TopLevelMixin):
+        return len(result.to_json())
+    return None
+
+
+def run(datasets, scales, repeat, max_kendall_rows, spec_max_rows, seed):
+    results = []
+    for name in datasets:
+        for rows in scales:
+            df = DATASETS[name](rows, seed=seed)
+            print("{0} rows={1:,} columns={2}".format(name, rows,
+                                                      df.shape[1]),
+                  flush=True)
+            for function, params, func in cases(df, max_kendall_rows):
+                result = {
+                    "function": function,
+                    "params": params,
+                    "dataset": name,
+                    "rows": rows,
+                    "columns": df.shape[1],
+                }
+                result.update(measure(func, repeat, spec_max_rows, rows))
+                print("  {0:<26} {1:<42} {2:9.4f}s {3:12,d}B".format(
+                    function, json.dumps(params), result["median_s"],
+                    result["peak_bytes"]
+                ), flush=True)
+                results.append(result)
+            del df
+    return results
+
+
+def metadata(args):
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "instaeda": instaeda.__version__,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "altair": alt.__version__,
+        "arguments": vars(args),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", nargs="+", choices=sorted(DATASETS),
+                        default=sorted(DATASETS))
+    parser.add_argument("--scales", nargs="+", type=lambda s: int(float(s)),
+                        default=[10 ** 3, 10 ** 4, 10 ** 5],
+                        help="row counts, e.g. 1e3 1e5 1e7")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-kendall-rows", type=int, default=10 ** 5,
+                        help="skip plot_corr(method='kendall') above this")
+    parser.add_argument("--spec-max-rows", type=int, default=10 ** 5,
+                        help="skip spec serialization above this")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    alt.data_transformers.disable_max_rows()
+    results = run(args.datasets, args.scales, args.repeat,
+                  args.max_kendall_rows, args.spec_max_rows, args.seed)
+    with open(args.output, "w") as output:
+        json.dump({"meta": metadata(args), "results": results}, output,
+                  indent=2)
+    print("Wrote {0} results to {1}".format(len(results), args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,21 @@
 __version__ = '0.1.8'
+
+__all__ = [
+    "plot_intro",
+    "plot_corr",
+    "divide_and_fill",
+    "plot_basic_distributions",
+    "missing_patterns",
+    "plot_missing_patterns",
+]
+
+
+def __getattr__(name):
+    # Public functions load on first access, so importing the package does
+    # not pull in pandas, and altair only loads when a chart is drawn.
+    if name in __all__:
+        from instaeda import instaeda
+        return getattr(instaeda, name)
+    raise AttributeError(
+        "module 'instaeda' has no attribute {0!r}".format(name)
+    )
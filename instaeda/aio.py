@@ -0,0 +1,103 @@
+"""Asyncio versions of the public functions.
+
+Each call runs in a shared pool of worker threads, so the event loop stays
+free while the numeric work runs. The pool size is the number of calls run
+at once in this process; further calls wait for a free worker. Cancelling
+the awaiting task stops the call at its next stage boundary.
+
+Examples
+-------
+>>> from instaeda import aio
+>>> aio.set_concurrency(2)
+>>> plots = await asyncio.gather(aio.plot_corr(df_1), aio.plot_corr(df_2))
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from instaeda import instaeda
+from instaeda.profiling import CancelToken, cancel_scope
+
+_lock = threading.Lock()
+_executor = None
+_concurrency = min(4, os.cpu_count() or 1)
+
+
+def set_concurrency(limit):
+    """Sets the number of instaeda calls run at once in this process.
+
+    Calls already running finish on the previous workers.
+    """
+    global _executor, _concurrency
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError("Can only use positive integer limit.")
+    with _lock:
+        previous, _executor = _executor, None
+        _concurrency = limit
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_concurrency():
+    """Returns the number of instaeda calls run at once in this process."""
+    return _concurrency
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_concurrency, thread_name_prefix="instaeda"
+            )
+        return _executor
+
+
+async def run(func, *args, **kwargs):
+    """Runs `func(*args, **kwargs)` in the worker pool and returns its
+    result. When the awaiting task is cancelled, an instaeda call stops at
+    its next stage boundary, or does not start if it is still waiting for a
+    worker."""
+    loop = asyncio.get_running_loop()
+    token = CancelToken()
+
+    def call():
+        with cancel_scope(token):
+            return func(*args, **kwargs)
+
+    try:
+        return await loop.run_in_executor(_get_executor(), call)
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
+
+
+async def plot_intro(df, *args, **kwargs):
+    """Asyncio version of `instaeda.plot_intro`."""
+    return await run(instaeda.plot_intro, df, *args, **kwargs)
+
+
+async def plot_corr(df, *args, **kwargs):
+    """Asyncio version of `instaeda.plot_corr`."""
+    return await run(instaeda.plot_corr, df, *args, **kwargs)
+
+
+async def divide_and_fill(dataframe, *args, **kwargs):
+    """Asyncio version of `instaeda.divide_and_fill`."""
+    return await run(instaeda.divide_and_fill, dataframe, *args, **kwargs)
+
+
+async def plot_basic_distributions(df, *args, **kwargs):
+    """Asyncio version of `instaeda.plot_basic_distributions`."""
+    return await run(instaeda.plot_basic_distributions, df, *args, **kwargs)
+
+
+async def missing_patterns(df, *args, **kwargs):
+    """Asyncio version of `instaeda.missing_patterns`."""
+    return await run(instaeda.missing_patterns, df, *args, **kwargs)
+
+
+async def plot_missing_patterns(df, *args, **kwargs):
+    """Asyncio version of `instaeda.plot_missing_patterns`."""
+    return await run(instaeda.plot_missing_patterns, df, *args, **kwargs)
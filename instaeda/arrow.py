@@ -0,0 +1,404 @@
+"""Support for ``pyarrow.Table``, Polars and Parquet/Feather file inputs.
+
+pyarrow and polars are optional: they are only imported once such an object
+is passed in. Missing values are nulls plus NaN in float columns, matching
+what ``pandas.isnull`` reports for the same data.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+FEATHER_SUFFIXES = (".feather", ".arrow", ".ipc")
+
+
+def is_arrow_like(data):
+    """Returns True for pyarrow Tables/RecordBatches and Polars frames."""
+    package = type(data).__module__.split(".")[0]
+    if package == "polars":
+        return hasattr(data, "to_arrow")
+    if package == "pyarrow":
+        import pyarrow as pa
+        return isinstance(data, (pa.Table, pa.RecordBatch))
+    return False
+
+
+def to_arrow(data):
+    """Returns `data` as a pyarrow Table, without copying column buffers."""
+    import pyarrow as pa
+
+    if isinstance(data, pa.Table):
+        return data
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    return data.to_arrow()
+
+
+def from_arrow(table, like):
+    """Converts `table` back to the type of the original input `like`."""
+    if type(like).__module__.split(".")[0] == "polars":
+        import polars as pl
+        return pl.from_arrow(table)
+    return table
+
+
+def is_path(data):
+    """Returns True for paths of Parquet or Feather files."""
+    if not isinstance(data, (str, os.PathLike)):
+        return False
+    suffix = os.path.splitext(os.fspath(data))[1].lower()
+    return suffix in PARQUET_SUFFIXES + FEATHER_SUFFIXES
+
+
+def _is_parquet(path):
+    return os.path.splitext(os.fspath(path))[1].lower() in PARQUET_SUFFIXES
+
+
+def file_schema(path):
+    """Returns the schema of a Parquet or Feather file from its footer."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if _is_parquet(path):
+        return pq.read_schema(path, memory_map=True)
+    with pa.memory_map(os.fspath(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def read_table(path, columns=None):
+    """Reads the columns `columns` (default all) of a Parquet or Feather
+    file through a memory map. Uncompressed Feather columns are zero-copy
+    views of the mapped file; Parquet only decodes the selected columns."""
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if _is_parquet(path):
+        return pq.read_table(path, columns=columns, memory_map=True)
+    return feather.read_table(path, columns=columns, memory_map=True)
+
+
+def open_rows(path):
+    """Opens a Parquet or Feather file for `read_rows` without decoding it:
+    a pyarrow.parquet.ParquetFile, or the memory-mapped Table of a Feather
+    file."""
+    import pyarrow.parquet as pq
+
+    if _is_parquet(path):
+        return pq.ParquetFile(path, memory_map=True)
+    return read_table(path)
+
+
+def row_count(source):
+    """Returns the number of rows of a Table or a ParquetFile."""
+    import pyarrow as pa
+
+    if isinstance(source, pa.Table):
+        return source.num_rows
+    return source.metadata.num_rows
+
+
+def read_rows(source, positions):
+    """Returns the rows at `positions`, in that order, of a Table or a
+    ParquetFile. From a ParquetFile only the row groups holding the rows
+    are decoded, one at a time."""
+    import pyarrow as pa
+
+    positions = np.asarray(positions, dtype=np.int64)
+    if isinstance(source, pa.Table):
+        return source.take(positions)
+
+    metadata = source.metadata
+    offsets = np.cumsum(
+        [0] + [metadata.row_group(i).num_rows
+               for i in range(metadata.num_row_groups)]
+    )
+    groups = np.searchsorted(offsets, positions, side="right") - 1
+    pieces = [
+        source.read_row_group(group).take(
+            positions[groups == group] - offsets[group]
+        )
+        for group in np.unique(groups)
+    ]
+    if not pieces:
+        return source.schema_arrow.empty_table()
+    # The pieces follow the row groups, so undo the stable sort by group
+    order = np.argsort(groups, kind="stable")
+    return pa.concat_tables(pieces).take(np.argsort(order))
+
+
+def read_file(path, cols=None, include=None, extra=None):
+    """Reads the columns of `cols` (default all) whose type matches
+    `include` ("number", "string" or None for any), plus the column `extra`.
+
+    Returns
+    -------
+    table : pyarrow.Table
+        The columns read.
+    selected : list
+        The columns of `cols` matching `include`, without `extra`.
+    """
+    schema = file_schema(path)
+    if cols is None:
+        cols = schema.names
+    missing_cols = [col for col in cols if col not in schema.names]
+    if missing_cols:
+        raise KeyError(
+            "Columns {0} are not in the dataframe".format(missing_cols)
+        )
+    kinds = {"number": numeric_columns(schema),
+             "string": string_columns(schema)}
+    selected = [
+        col for col in cols if include not in kinds or col in kinds[include]
+    ]
+    columns = list(selected)
+    if extra is not None and extra not in columns and extra in schema.names:
+        columns.append(extra)
+    return read_table(path, columns), selected
+
+
+def file_intro_metrics(path):
+    """Returns the plot_intro metrics of a Parquet or Feather file.
+
+    Parquet columns are read one at a time, so memory stays at one decoded
+    column. The footer statistics cannot answer the metrics on their own:
+    they do not count NaN and pyarrow does not write distinct counts.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    if not _is_parquet(path):
+        return intro_metrics(read_table(path))
+
+    metadata = pq.read_metadata(path, memory_map=True)
+    schema = file_schema(path)
+    missing_counts = []
+    distinct_values = 0
+    memory_usage = 0
+    for field in schema:
+        column = read_table(path, [field.name]).column(0)
+        missing_counts.append(missing_count(column))
+        distinct_values += pc.count_distinct(column,
+                                             mode="only_valid").as_py()
+        memory_usage += column.nbytes
+
+    num_rows = metadata.num_rows
+    return {
+        "rows": num_rows,
+        "columns": len(schema),
+        "numeric_columns": len(numeric_columns(schema)),
+        "all_missing_columns": sum(missing_counts),
+        "total_missing_values": sum(missing_counts),
+        "complete_rows": num_rows - sum(missing_counts),
+        "total_observations": num_rows * len(schema),
+        "memory_usage": memory_usage,
+        "distinct_values": distinct_values,
+    }
+
+
+def value_ranges(path, cols):
+    """Returns {column: (min, max)} of the numeric columns `cols` of a
+    Parquet file, merged over the row-group statistics of its footer, or
+    {} for Feather files. Columns are left out when a row group holding
+    values does not record both. Parquet statistics skip NaN."""
+    import pyarrow.parquet as pq
+
+    if not _is_parquet(path):
+        return {}
+    numeric = set(numeric_columns(file_schema(path)))
+    metadata = pq.read_metadata(path, memory_map=True)
+    ranges = {}
+    unknown = set()
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            col = chunk.path_in_schema
+            if col not in cols or col not in numeric:
+                continue
+            stats = chunk.statistics
+            if stats is not None and stats.has_min_max:
+                low, high = ranges.get(col, (stats.min, stats.max))
+                ranges[col] = (min(low, stats.min), max(high, stats.max))
+            elif stats is None or stats.null_count != row_group.num_rows:
+                # Only row groups without any value may lack min/max
+                unknown.add(col)
+    return {
+        col: ranges[col] for col in cols
+        if col in ranges and col not in unknown
+    }
+
+
+def numeric_columns(table):
+    """Returns the names of the integer and floating point columns of a
+    Table or a Schema."""
+    import pyarrow as pa
+
+    return [
+        field.name for field in getattr(table, "schema", table)
+        if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+    ]
+
+
+def string_columns(table):
+    """Returns the names of the string and dictionary-encoded columns of a
+    Table or a Schema."""
+    import pyarrow as pa
+
+    return [
+        field.name for field in getattr(table, "schema", table)
+        if pa.types.is_string(field.type)
+        or pa.types.is_large_string(field.type)
+        or pa.types.is_dictionary(field.type)
+    ]
+
+
+def missing_mask(column):
+    """Returns a boolean ChunkedArray marking null (and NaN) values, built
+    from the validity bitmaps."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    return pc.is_null(
+        column, nan_is_null=pa.types.is_floating(column.type)
+    )
+
+
+def missing_count(column):
+    """Returns the number of missing values of a column. Non-float columns
+    read it from the validity bitmap metadata without touching the data."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not pa.types.is_floating(column.type):
+        return column.null_count
+    return pc.sum(missing_mask(column)).as_py() or 0
+
+
+def intro_metrics(table):
+    """Returns the plot_intro metrics of a Table, computed from validity
+    bitmaps, the schema and hash-based distinct counts. The missing value
+    counts follow the definitions of the pandas code path."""
+    import pyarrow.compute as pc
+
+    missing_counts = [
+        missing_count(table.column(name)) for name in table.column_names
+    ]
+    distinct_values = sum(
+        pc.count_distinct(table.column(name), mode="only_valid").as_py()
+        for name in table.column_names
+    )
+
+    return {
+        "rows": table.num_rows,
+        "columns": table.num_columns,
+        "numeric_columns": len(numeric_columns(table)),
+        "all_missing_columns": sum(missing_counts),
+        "total_missing_values": sum(missing_counts),
+        "complete_rows": table.num_rows - sum(missing_counts),
+        "total_observations": table.num_rows * table.num_columns,
+        "memory_usage": table.nbytes,
+        "distinct_values": distinct_values,
+    }
+
+
+def iter_batches(data, cols, batch_size):
+    """Yields RecordBatches of at most `batch_size` rows of the columns
+    `cols` of an Arrow or Polars input or a Parquet or Feather path. Parquet
+    files are decoded one batch at a time."""
+    import pyarrow.parquet as pq
+
+    if is_path(data) and _is_parquet(data):
+        parquet_file = pq.ParquetFile(data, memory_map=True)
+        yield from parquet_file.iter_batches(batch_size=batch_size,
+                                             columns=cols)
+        return
+    table = read_table(data, cols) if is_path(data) else to_arrow(data)
+    yield from table.select(cols).to_batches(max_chunksize=batch_size)
+
+
+def missing_matrix(batch):
+    """Returns the (rows, columns) boolean missing-value mask of a
+    RecordBatch or Table."""
+    mask = np.empty((batch.num_rows, batch.num_columns), dtype=bool)
+    for i, column in enumerate(batch.columns):
+        mask[:, i] = missing_mask(column).to_numpy(zero_copy_only=False)
+    return mask
+
+
+def numeric_view(column):
+    """Returns a numeric column as a numpy array. A single chunk without
+    nulls is a zero-copy view of the Arrow buffer; otherwise the chunks are
+    copied once and nulls become NaN."""
+    if column.num_chunks == 1 and column.null_count == 0:
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+    return column.to_numpy()
+
+
+def pandas_frame(table, cols):
+    """Returns a pandas DataFrame of the columns `cols`. Numeric columns
+    without nulls in a single chunk are numpy views of the Arrow buffers;
+    only the remaining requested columns are converted to Python objects."""
+    # One block per column keeps pandas from consolidating the views into
+    # a copy, whatever the pandas version. Without the pandas metadata the
+    # index is a RangeIndex, as for the other inputs.
+    return (
+        table.select(cols)
+        .replace_schema_metadata(None)
+        .to_pandas(split_blocks=True)
+    )
+
+
+def category_counts(column):
+    """Returns the number of rows per category of a string column, counted
+    on dictionary indices so no Python string is created per row.
+
+    Returns
+    -------
+    counts : pd.Series
+        Counts indexed by category, most frequent first. Nulls are not
+        counted.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not pa.types.is_dictionary(column.type):
+        column = column.dictionary_encode()
+    column = pa.table({"column": column}).unify_dictionaries()["column"]
+    if column.num_chunks == 0:
+        return pd.Series([], dtype="int64")
+
+    dictionary = column.chunk(0).dictionary
+    counts = np.zeros(len(dictionary), dtype=np.int64)
+    for chunk in column.chunks:
+        indices = pc.drop_null(chunk.indices).to_numpy()
+        counts += np.bincount(indices, minlength=len(dictionary))
+
+    return (
+        pd.Series(counts, index=dictionary.to_pandas())
+        .loc[lambda series: series > 0]
+        .sort_values(ascending=False, kind="mergesort")
+    )
+
+
+def sample_table(table, sample, stratify=None, random_state=None):
+    """Returns a random sample of the rows of `table` and its row count.
+
+    Only the row positions and, if given, the `stratify` column pass
+    through `instaeda.sampling.draw_sample`; the sampled rows are then
+    gathered with `Table.take`.
+    """
+    from instaeda.sampling import draw_sample
+
+    positions = pd.DataFrame({"__position": np.arange(table.num_rows)})
+    if stratify is not None:
+        if stratify not in table.column_names:
+            raise KeyError(
+                "The stratify column {0} is not in the dataframe".format(
+                    stratify
+                )
+            )
+        positions[stratify] = table.column(stratify).to_pandas()
+    sampled, population = draw_sample(positions, sample, stratify=stratify,
+                                      random_state=random_state)
+    return table.take(sampled["__position"].to_numpy()), population
@@ -0,0 +1,250 @@
+import sys
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "entries", "bytes",
+                  "max_bytes"]
+)
+
+
+def fingerprint(df, sample_rows=64):
+    """Returns a cheap key identifying the contents of a dataframe.
+
+    The key combines the shape, the column labels and dtypes, the addresses
+    of the underlying data buffers and a hash of up to `sample_rows` evenly
+    spaced rows. Two frames sharing the key are treated as equal, so a frame
+    mutated in place outside the sampled rows keeps its fingerprint. This is
+    why the shared cache is off unless a `session` is open.
+
+    Parameters
+    -----------
+    df: pd.DataFrame
+        Dataframe to fingerprint.
+    sample_rows : integer, optional
+        Number of rows hashed. By default, 64.
+
+    Returns
+    -------
+    key : tuple
+        Hashable fingerprint of the dataframe.
+    """
+    positions = np.unique(
+        np.linspace(0, max(len(df) - 1, 0), min(sample_rows, len(df)))
+        .astype(np.intp)
+    )
+    try:
+        sampled = pd.util.hash_pandas_object(df.iloc[positions], index=True)
+        sampled = sampled.to_numpy().tobytes()
+    except TypeError:
+        # Unhashable cells such as lists fall back to buffer identity only
+        sampled = None
+    return (
+        df.shape,
+        tuple(df.columns),
+        tuple(str(dtype) for dtype in df.dtypes),
+        _buffer_addresses(df),
+        sampled,
+    )
+
+
+class ComputationCache:
+    """Least-recently-used cache of artifacts derived from dataframes, such
+    as dtype partitions, null masks and counts, correlation matrices and
+    column sketches, keyed by the dataframe fingerprint.
+
+    Parameters
+    -----------
+    max_bytes : integer, optional
+        Memory cap for the cached artifacts. The least recently used entries
+        are evicted once it is exceeded; 0 disables caching.
+        By default, 256 MiB.
+
+    Examples
+    -------
+    >>> cache = ComputationCache(max_bytes=64 * 2 ** 20)
+    >>> counts = cache.get_or_compute(df, "null_counts",
+                                      lambda: df.isnull().sum())
+    >>> cache.info()
+    """
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError("Can only use non-negative integer max_bytes.")
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def get_or_compute(self, df, key, compute, frame_key=None):
+        """Returns the artifact `key` of `df`, calling `compute()` to build
+        and store it on a miss. Callers doing several lookups on the same
+        frame can pass its precomputed `fingerprint` as `frame_key`."""
+        if self.max_bytes == 0:
+            return compute()
+
+        if frame_key is None:
+            frame_key = fingerprint(df)
+        entry_key = (frame_key, key)
+        with self._lock:
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+                self._hits += 1
+                return self._entries[entry_key][0]
+            self._misses += 1
+
+        value = compute()
+        size = _nbytes(value)
+        with self._lock:
+            if size <= self.max_bytes and entry_key not in self._entries:
+                self._entries[entry_key] = (value, size)
+                self._bytes += size
+                self._evict()
+        return value
+
+    def resize(self, max_bytes):
+        """Changes the memory cap, evicting entries that no longer fit."""
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError("Can only use non-negative integer max_bytes.")
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Drops every entry and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        """Returns hit, miss and eviction counts and the current size."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             len(self._entries), self._bytes, self.max_bytes)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+DEFAULT_SESSION_BYTES = 256 * 2 ** 20
+
+# Off by default: results would go stale after in-place edits
+_cache = ComputationCache(max_bytes=0)
+
+
+def cached(df, key, compute, frame_key=None):
+    """Looks up `key` for `df` in the shared instaeda cache."""
+    return _cache.get_or_compute(df, key, compute, frame_key)
+
+
+@contextmanager
+def session(max_bytes=DEFAULT_SESSION_BYTES):
+    """Shares derived artifacts between instaeda calls inside the block.
+
+    Do not edit the dataframes in place inside the session, as the cache
+    may then return results computed before the edit. The cache is emptied
+    and its previous limit restored when the block exits.
+
+    Parameters
+    -----------
+    max_bytes : integer, optional
+        Memory cap for the cached artifacts. By default, 256 MiB.
+
+    Examples
+    -------
+    >>> from instaeda import cache
+    >>> with cache.session():
+    ...     instaeda.plot_intro(df)
+    ...     instaeda.plot_basic_distributions(df)
+    """
+    previous = _cache.info().max_bytes
+    _cache.resize(max_bytes)
+    try:
+        yield _cache
+    finally:
+        _cache.resize(previous)
+        _cache.clear()
+
+
+def cache_key(df):
+    """Returns the `fingerprint` of `df` to pass to several `cached`
+    lookups, or None without computing it while the shared cache is off."""
+    if _cache.max_bytes == 0:
+        return None
+    return fingerprint(df)
+
+
+def cache_info():
+    """Returns the statistics of the cache shared by instaeda functions.
+
+    Returns
+    -------
+    info : CacheInfo
+        Named tuple of hits, misses, evictions, entries, bytes and
+        max_bytes.
+
+    Examples
+    -------
+    >>> from instaeda import cache
+    >>> cache.cache_info()
+    CacheInfo(hits=3, misses=5, evictions=0, entries=5, bytes=2048, ...)
+    """
+    return _cache.info()
+
+
+def clear_cache():
+    """Empties the cache shared by instaeda functions."""
+    _cache.clear()
+
+
+def set_cache_limit(max_bytes):
+    """Sets the memory cap of the cache shared by instaeda functions.
+
+    Parameters
+    -----------
+    max_bytes : integer
+        New cap in bytes; 0, the default, disables caching. Prefer
+        `session`, which also empties the cache afterwards.
+    """
+    _cache.resize(max_bytes)
+
+
+def _buffer_addresses(df):
+    addresses = []
+    for col in range(df.shape[1]):
+        series = df.iloc[:, col]
+        if isinstance(series.dtype, np.dtype):
+            data = series.to_numpy(copy=False)
+            addresses.append(data.__array_interface__["data"][0])
+        else:
+            # Extension arrays are kept by identity
+            addresses.append(id(series.array))
+    return tuple(addresses)
+
+
+def _nbytes(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _nbytes(item) for item in value.values()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + _nbytes(vars(value))
+    return sys.getsizeof(value)
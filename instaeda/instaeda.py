@@ -1,9 +1,14 @@
 import numpy as np
 import pandas as pd
-import altair as alt
-from sklearn.impute import SimpleImputer
+import itertools
 import warnings
 
+from instaeda import arrow, kernels
+from instaeda.cache import cache_key, cached
+from instaeda.profiling import stage_timer
+from instaeda.sampling import draw_sample, sampling_error
+from instaeda.sketches import HyperLogLog
+
 
 def plot_intro(df, plot_title="", theme_config="Dimension"):
     """Takes a dataframe with configurations and
@@ -11,9 +16,12 @@ def plot_intro(df, plot_title="", theme_config="Dimension"):
 
     Parameters
     -----------
-    df: pd.DataFrame
+    df: pd.DataFrame, pyarrow.Table, polars.DataFrame or path
         Dataframe from which to take columns
-        not limited to numerical columns only
+        not limited to numerical columns only. Arrow and Polars inputs are
+        profiled from their validity bitmaps without converting to pandas.
+        Parquet (.parquet, .pq) and Feather (.feather, .arrow, .ipc) paths
+        are memory-mapped and read one column at a time.
     plot_title : string, optional
         User can specify the plot title, by default to show the memory usage
     theme_config : list, optional
@@ -24,7 +32,9 @@ def plot_intro(df, plot_title="", theme_config="Dimension"):
     -------
     plot : altair.Chart object
         An altair plot object displaying summary metrics including the memory
-        usage and the basic description of the input data.
+        usage and the basic description of the input data. Distinct Values
+        is the approximate number of distinct values per column (from
+        HyperLogLog sketches) relative to the non-missing observations.
 
     Examples
     -------
@@ -38,28 +48,25 @@ def plot_intro(df, plot_title="", theme_config="Dimension"):
     >>> instaeda_py.plot_intro(example_df)
     """
 
-    # Check basic information for input data
-    sum_missing_columns = df.isnull().sum(axis=0)
-    num_of_all_missing_columns = sum(sum_missing_columns)
+    import altair as alt
 
-    sum_missing_rows = df.isnull().sum(axis=1)
-    num_complete_rows = df.shape[0] - sum(sum_missing_rows)
+    timer = stage_timer("plot_intro", df)
+
+    # Check basic information for input data
+    if arrow.is_path(df):
+        info = arrow.file_intro_metrics(df)
+        timer.lap("null_scan")
+    elif arrow.is_arrow_like(df):
+        info = arrow.intro_metrics(arrow.to_arrow(df))
+        timer.lap("null_scan")
+    else:
+        info = _intro_metrics(df, timer)
 
     # Create info dataframe
-    info_df = pd.DataFrame(
-        {
-            "rows": df.shape[0],
-            "columns": df.shape[1],
-            "numeric_columns": len(
-                list(df.select_dtypes(include=[np.number]).columns.values)
-            ),
-            "all_missing_columns": num_of_all_missing_columns,
-            "total_missing_values": df.isnull().sum().sum(),
-            "complete_rows": num_complete_rows,
-            "total_observations": df.shape[0] * df.shape[1],
-            "memory_usage": df.memory_usage(deep=True).sum(),
-        },
-        index=[0],
+    info_df = pd.DataFrame(info, index=[0])
+    num_present_values = max(
+        int(info_df["total_observations"] - info_df["total_missing_values"]),
+        1
     )
 
     # Create the plotting dataframe
@@ -70,6 +77,7 @@ def plot_intro(df, plot_title="", theme_config="Dimension"):
                 "All Missing Columns",
                 "Missing Observations",
                 "Complete Rows",
+                "Distinct Values",
             ],
             "Value": [
                 float(info_df["numeric_columns"] / info_df["columns"]),
@@ -77,10 +85,14 @@ def plot_intro(df, plot_title="", theme_config="Dimension"):
                 float(info_df["total_missing_values"] /
                       info_df["total_observations"]),
                 float(info_df["complete_rows"] / info_df["rows"]),
+                float(info_df["distinct_values"] / num_present_values),
+            ],
+            "Dimension": [
+                "column", "column", "observation", "row", "observation"
             ],
-            "Dimension": ["column", "column", "observation", "row"],
         }
     )
+    timer.lap("aggregation")
 
     # Create the plot
 
@@ -109,18 +121,34 @@ def plot_intro(df, plot_title="", theme_config="Dimension"):
             )
         )
 
+    timer.lap("chart")
     return intro_plot
 
 
-def plot_corr(df, cols=None, method="pearson", colour_palette="purpleorange"):
+def plot_corr(
+    df,
+    cols=None,
+    method="pearson",
+    colour_palette="purpleorange",
+    sample=None,
+    random_state=None,
+    precision="float64",
+    order=None,
+    top_k=None,
+    threshold=None,
+    max_text_cells=400,
+):
     """Takes a dataframe, subsets numeric columns and returns a correlation
     plot object.
 
     Parameters
     -----------
-    df: pd.DataFrame
+    df: pd.DataFrame, pyarrow.Table or polars.DataFrame
         Dataframe from which to take columns and calculate, plot correlation
-        between columns.
+        between columns. When `sample` is set, an iterable of dataframe
+        chunks is also accepted. Numeric columns of Arrow and Polars inputs
+        are read as zero-copy numpy views. For a Parquet or Feather path
+        only the numeric columns of `cols` are read, memory-mapped.
     cols: list, optional
         List of columns to perform correlation on.
         By default, None (perform on all numeric).
@@ -129,12 +157,40 @@ def plot_corr(df, cols=None, method="pearson", colour_palette="purpleorange"):
         {'pearson', 'kendall', 'spearman'}. By default 'pearson'
     colour_palette : string, optional
         one of Altair accepted colour schemes
+    sample : integer, optional
+        Compute correlations on a uniform random sample of this many rows,
+        drawn with reservoir sampling so chunked inputs are streamed.
+        The sample size and the 95% sampling error are shown in the subtitle.
+        By default, None (use all rows).
+    random_state : int or numpy.random.Generator, optional
+        Seed for the sample. By default, None.
+    precision : string, optional
+        "float64" or "float32". With "float32", pearson and spearman
+        correlations are computed in float32 blocks summed in float64,
+        without a float64 copy of the data; the error stays below 1e-4, the
+        displayed rounding. Kendall, and spearman with missing values, are
+        computed in float64. By default, "float64".
+    order : string, optional
+        "cluster" orders the variables by average-linkage hierarchical
+        clustering on the distance 1 - |correlation|, so correlated
+        variables sit next to each other. By default, None (alphabetical).
+    top_k : integer, optional
+        Only plot the `top_k` variables with the strongest correlation to
+        another variable. By default, None (all variables).
+    threshold : float, optional
+        Only plot variables with an absolute correlation of at least
+        `threshold` to another variable, and leave weaker cells blank.
+        By default, None.
+    max_text_cells : integer, optional
+        Above this number of cells the correlation values are not written
+        in the cells, which keeps large charts small and fast to render.
+        None always writes them. By default, 400.
 
     Returns
     -------
-    plot : altair.Chart object
+    plot : altair.LayerChart or altair.Chart object
         Correlation plot object displaying column names and corresponding
-        correlation values.
+        correlation values; an altair.Chart when the values are not written.
 
     Examples
     -------
@@ -148,6 +204,8 @@ def plot_corr(df, cols=None, method="pearson", colour_palette="purpleorange"):
     >>> instaeda_py.plot_corr(example_df)
     """
 
+    import altair as alt
+
     # check user input
     correlation_methods = {"pearson", "kendall", "spearman"}
     colour_palette_list = {
@@ -163,40 +221,108 @@ def plot_corr(df, cols=None, method="pearson", colour_palette="purpleorange"):
         "spectral",
     }
     numeric_cols = ["int16", "int32", "int64", "float16", "float32", "float64"]
+    timer = stage_timer("plot_corr", df)
+    if arrow.is_path(df):
+        df, cols = arrow.read_file(df, cols, include="number")
+        timer.lap("read", shape=(df.num_rows, df.num_columns))
+    if arrow.is_arrow_like(df):
+        table = arrow.to_arrow(df)
+        if sample is not None:
+            table, population = arrow.sample_table(
+                table, sample, random_state=random_state
+            )
+            timer.lap("sampling", shape=(population, table.num_columns))
+        # Only numeric columns leave Arrow, as zero-copy numpy views
+        number_cols = arrow.numeric_columns(table)
+        if cols is not None:
+            cols = [
+                col for col in cols
+                if col in number_cols or col not in table.column_names
+            ]
+        df = arrow.pandas_frame(
+            table,
+            number_cols if cols is None
+            else [col for col in cols if col in number_cols]
+        )
+    elif sample is not None:
+        df, population = draw_sample(df, sample, random_state=random_state)
+        timer.lap("sampling", shape=(population, df.shape[1]))
     if not isinstance(df, pd.DataFrame):
         raise Exception("must pass in pandas DataFrame")
     if method not in correlation_methods:
         raise Exception("correlation method not acceptable")
     if colour_palette not in colour_palette_list:
         warnings.warn("Recommended Altair continuous diverging colour palette")
+    _check_precision(precision)
+    if order not in (None, "cluster"):
+        raise ValueError("order must be None or 'cluster'")
+    if top_k is not None and (
+        isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 2
+    ):
+        raise ValueError("Can only use integer top_k of at least 2.")
+    if threshold is not None and not 0 <= threshold <= 1:
+        raise ValueError("threshold must be between 0 and 1.")
+    if max_text_cells is not None and (
+        isinstance(max_text_cells, bool)
+        or not isinstance(max_text_cells, int)
+        or max_text_cells < 0
+    ):
+        raise ValueError("Can only use non-negative integer max_text_cells.")
 
     # calculate
-    if cols is None:
-        if df.select_dtypes(np.number).shape[1] < 2:
-            raise Exception(
-                "Dataframe does not have enough numeric columns for comparison"
-            )
-        df = df.select_dtypes(include=numeric_cols)
-    else:
-        if df[cols].select_dtypes(np.number).shape[1] < 2:
-            raise Exception(
-                "Dataframe does not have enough numeric columns for comparison"
+    frame_key = cache_key(df)
+    number_cols = _dtype_columns(df, frame_key, include="number")
+    if cols is not None:
+        missing_cols = [col for col in cols if col not in df.columns]
+        if missing_cols:
+            raise KeyError(
+                "Columns {0} are not in the dataframe".format(missing_cols)
             )
-        df = df[cols].select_dtypes(include=numeric_cols)
+        number_set = set(number_cols)
+        number_cols = [col for col in cols if col in number_set]
+    if len(number_cols) < 2:
+        raise Exception(
+            "Dataframe does not have enough numeric columns for comparison"
+        )
+    corr_cols = [
+        col for col in number_cols if str(df[col].dtype) in numeric_cols
+    ]
+    timer.lap("validation", shape=df.shape)
+
+    corr_matrix = cached(
+        df, ("corr", method, tuple(corr_cols), precision),
+        lambda: _correlation(df, corr_cols, method, precision), frame_key
+    )
+    corr_matrix = _prune_correlations(corr_matrix, top_k, threshold)
+    variable_order = alt.Undefined
+    if order == "cluster":
+        variable_order = [
+            corr_matrix.index[i]
+            for i in _cluster_order(corr_matrix.to_numpy())
+        ]
     corr_df = (
-        round(df.corr(method=method), 4)
+        round(corr_matrix, 4)
         .stack()
         .reset_index(name="corr")
         .rename(columns={"level_0": "variable_1", "level_1": "variable_2"})
     )
+    if threshold is not None:
+        corr_df = corr_df[
+            (corr_df["corr"].abs() >= threshold)
+            | (corr_df["variable_1"] == corr_df["variable_2"])
+        ]
+    timer.lap("correlation", shape=(df.shape[0], len(corr_cols)))
 
     # plot base plot
+    title = "Correlations between variables"
+    if sample is not None:
+        title = _sampled_title(title, len(df), population, "correlation")
     corr_plot = (
-        alt.Chart(corr_df, title="Correlations between variables")
+        alt.Chart(corr_df, title=title)
         .mark_rect()
         .encode(
-            x=alt.X("variable_1", title=""),
-            y=alt.Y("variable_2", title=""),
+            x=alt.X("variable_1", title="", sort=variable_order),
+            y=alt.Y("variable_2", title="", sort=variable_order),
             color=alt.Color(
                 "corr", scale=alt.Scale(scheme=colour_palette, domain=(-1, 1))
             ),
@@ -205,11 +331,14 @@ def plot_corr(df, cols=None, method="pearson", colour_palette="purpleorange"):
     )
 
     # plot corr values
-    text = corr_plot.mark_text().encode(
-        text="corr:Q",
-        color=alt.value("black"))
+    if max_text_cells is None or len(corr_df) <= max_text_cells:
+        text = corr_plot.mark_text().encode(
+            text="corr:Q",
+            color=alt.value("black"))
 
-    return corr_plot + text
+        corr_plot = corr_plot + text
+    timer.lap("chart", shape=corr_df.shape)
+    return corr_plot
 
 
 def divide_and_fill(
@@ -221,14 +350,18 @@ def divide_and_fill(
     random=False,
     parts=1,
     verbose=0,
+    sink=None,
 ):
     """Takes a dataframe, subsets selected columns and divides into parts for
     imputation of missing values and returns a data frame.
 
     Parameters
     -----------
-    dataframe: pd.DataFrame
+    dataframe: pd.DataFrame, pyarrow.Table or polars.DataFrame
         Dataframe from which to take columns and check for missing values.
+        For Arrow and Polars inputs only `cols` are converted; the result
+        has the type of the input. A Parquet or Feather path is read
+        memory-mapped and the result is a pyarrow.Table.
     cols: list, optional
         List of columns to perform imputation on.
         By default, None (perform on all numeric columns).
@@ -247,15 +380,26 @@ def divide_and_fill(
         When random == True, shuffles data frame before filling.
         By default, False.
     parts : integer, optional
-        The number of parts to divide rows of data frame into. By default, 1.
+        The number of parts to divide rows of data frame into, by row
+        position whatever the index labels. By default, 1.
     verbose : integer, optional
         Controls the verbosity of the divide and fill. By default, 0.
-
+    sink : string, path or file object, optional
+        Write the filled data frame to this Parquet file instead of
+        returning it. Each part is appended as a row group as soon as no
+        later part can change its rows, so memory holds about one part
+        rather than a copy of the whole data frame; a Parquet input path is
+        read one part at a time too, but with `random` every part decodes
+        the whole input file. The file has the same rows as the
+        returned data frame would, without its index, and filled integer
+        columns are written as float64. By default, None.
 
     Returns
     -------
     dataframe : pandas.DataFrame object
         Data frame obtained after divide and fill on the corresponding columns.
+        A pyarrow.Table or polars.DataFrame when the input is one or a
+        path. With `sink`, the sink is returned.
 
     Examples
     -------
@@ -272,6 +416,26 @@ def divide_and_fill(
     """
     filled_df = None
     allowed_strategies = ["mean", "median", "constant", "most_frequent"]
+    timer = stage_timer("divide_and_fill", dataframe)
+
+    source = dataframe
+    if arrow.is_path(dataframe) and sink is not None:
+        # The sink reads the rows of each part as it is filled, so the file
+        # is never decoded at once; inputs are checked on the empty frame
+        source = arrow.open_rows(dataframe)
+        dataframe = arrow.read_rows(source, []).to_pandas()
+    elif arrow.is_path(dataframe):
+        dataframe = arrow.read_table(dataframe)
+        timer.lap("read", shape=(dataframe.num_rows, dataframe.num_columns))
+    if arrow.is_arrow_like(dataframe):
+        if sink is None:
+            return _divide_and_fill_arrow(
+                dataframe, cols, missing_values, strategy, fill_value, random,
+                parts, verbose
+            )
+        # Inputs are checked on the empty frame holding the column dtypes
+        source = arrow.to_arrow(dataframe)
+        dataframe = source.slice(0, 0).to_pandas()
 
     # Checking inputs
     if verbose:
@@ -280,8 +444,10 @@ def divide_and_fill(
     if not isinstance(dataframe, pd.DataFrame):
         raise Exception("The input data must be of type pandas.DataFrame!")
 
+    frame_key = cache_key(dataframe)
+    number_cols = _dtype_columns(dataframe, frame_key, include="number")
     if cols is None:
-        cols = list(dataframe.select_dtypes(include="number").columns)
+        cols = list(number_cols)
 
     if (
         not isinstance(cols, list)
@@ -331,22 +497,15 @@ def divide_and_fill(
     if not isinstance(verbose, int):
         raise ValueError("Can only use integer for verbose.")
 
-    # Constructing filled dataframe skeleton.
-    if verbose:
-        print("Constructing filled dataframe skeleton.")
-
-    if random:
-        filled_df = dataframe.copy().sample(frac=1).reset_index(drop=True)
-    else:
-        filled_df = dataframe.copy()
-
-    if (set(cols) <= set(dataframe.select_dtypes(include="number").columns)):
+    if set(cols) <= set(number_cols):
         if isinstance(fill_value, str):
             raise ValueError('''
                 For numeric columns,
                 can only use fill values: (int, float, None)
             ''')
-    elif (set(cols) <= set(dataframe.select_dtypes(exclude="number").columns)):
+    elif set(cols) <= set(
+        _dtype_columns(dataframe, frame_key, exclude="number")
+    ):
         if isinstance(fill_value, int) or isinstance(fill_value, float):
             raise ValueError('''
                 For non-numeric columns,
@@ -356,19 +515,49 @@ def divide_and_fill(
         raise Exception('''
             All items in list cols must be numeric, or non-numeric.
             ''')
+    timer.lap("validation")
 
-    # Filling data frame
-    spacing = filled_df.shape[0]/(parts + 1)
-    index = np.arange(0, filled_df.shape[0] + spacing, spacing, dtype=int)
-    for i in range(len(index) - 1):
-        imputer = SimpleImputer(
-            missing_values=missing_values,
-            strategy=strategy,
-            fill_value=fill_value
+    if sink is not None:
+        if random and not isinstance(source, pd.DataFrame) and (
+            not arrow.is_arrow_like(source)
+        ):
+            warnings.warn(
+                "With random=True the shuffled rows of every part are spread "
+                "over all row groups, so the Parquet input is decoded about "
+                "{0} times".format(parts + 1)
+            )
+        if verbose:
+            print("Writing filled parts to the sink.")
+        n_rows = _fill_to_parquet(
+            source, cols, missing_values, strategy, fill_value, random,
+            parts, sink
         )
-        filled_df.loc[index[i]: index[i + 1], cols] = imputer.fit_transform(
-            filled_df.loc[index[i]: index[i + 1], cols]
+        timer.lap("imputation", shape=(n_rows, len(cols)))
+        return sink
+
+    # Constructing filled dataframe skeleton.
+    if verbose:
+        print("Constructing filled dataframe skeleton.")
+
+    if random:
+        filled_df = dataframe.copy().sample(frac=1).reset_index(drop=True)
+    else:
+        filled_df = dataframe.copy()
+    timer.lap("copy")
+
+    # Filling data frame, by row position like the sink whatever the index
+    positions = [filled_df.columns.get_loc(col) for col in cols]
+    for start, stop in _part_bounds(filled_df.shape[0], parts):
+        rows = slice(start, stop + 1)
+        part = _impute(
+            filled_df.iloc[rows, positions],
+            missing_values,
+            strategy,
+            fill_value
         )
+        for i, position in enumerate(positions):
+            filled_df.iloc[rows, position] = part.iloc[:, i].to_numpy()
+    timer.lap("imputation", shape=(filled_df.shape[0], len(cols)))
 
     if verbose:
         print("Returning data frame.")
@@ -379,14 +568,25 @@ def plot_basic_distributions(
     df,
     cols=None,
     include=None,
-    vega_theme="ggplot2"
+    vega_theme="ggplot2",
+    sample=None,
+    stratify=None,
+    random_state=None,
+    max_categories=50,
+    precision="float64",
 ):
     """Takes a dataframe and generates plots based on types
 
     Parameters
     -----------
-    df: pd.DataFrame
-        Dataframe from which to generate plots for each column from
+    df: pd.DataFrame, pyarrow.Table or polars.DataFrame
+        Dataframe from which to generate plots for each column from.
+        When `sample` is set, an iterable of dataframe chunks is also
+        accepted. String columns of Arrow and Polars inputs are counted via
+        dictionary encoding and charted from the counts. For a Parquet or
+        Feather path only `cols` of the included types are read,
+        memory-mapped, and histogram ranges come from the Parquet row-group
+        min/max statistics when present.
     cols: list, optional
         List of columns to generate plots for.
         By default, None (builds charts for all columns).
@@ -399,6 +599,25 @@ def plot_basic_distributions(
         The options include: excel, ggplot2,
         quartz, vox, fivethirtyeight, dark, latimes, urbaninstitute,
         and googlecharts. By default, it uses ggplot2.
+    sample : integer, optional
+        Build the charts from a random sample of this many rows, drawn with
+        reservoir sampling so chunked inputs are streamed. The sample size
+        and the 95% sampling error are shown in each chart subtitle.
+        By default, None (use all rows).
+    stratify : string, optional
+        Column whose categories are sampled proportionally, keeping at least
+        one row of every category. Only used with `sample`. By default, None.
+    random_state : int or numpy.random.Generator, optional
+        Seed for the sample. By default, None.
+    max_categories : integer, optional
+        String columns whose approximate number of distinct values exceeds
+        this limit only chart their most frequent `max_categories` values.
+        By default, 50.
+    precision : string, optional
+        "float64" or "float32". With "float32", histograms are binned in
+        float32 blocks before charting, on the bins Vega-Lite would pick;
+        only values within float32 rounding of a bin edge can change bin.
+        The chart data is then one row per bin. By default, "float64".
 
     Returns
     -------
@@ -417,6 +636,48 @@ def plot_basic_distributions(
                                     'num_specimen_seen': [10, 2, 1, 8]})
     >>> instaeda_py.plot_distribution(example_df)
     """
+    import altair as alt
+
+    timer = stage_timer("plot_basic_distributions", df)
+    string_counts = {}
+    value_ranges = {}
+    if arrow.is_path(df):
+        path = df
+        df, cols = arrow.read_file(
+            path, cols, include=include,
+            extra=stratify if sample is not None else None
+        )
+        value_ranges = arrow.value_ranges(path, cols)
+        timer.lap("read", shape=(df.num_rows, df.num_columns))
+    if arrow.is_arrow_like(df):
+        table = arrow.to_arrow(df)
+        if sample is not None:
+            table, population = arrow.sample_table(
+                table, sample, stratify=stratify, random_state=random_state
+            )
+            timer.lap("sampling", shape=(population, table.num_columns))
+        if cols is not None:
+            missing_cols = [
+                col for col in cols if col not in table.column_names
+            ]
+            if missing_cols:
+                raise KeyError(
+                    "Columns {0} are not in the dataframe".format(missing_cols)
+                )
+            table = table.select(cols)
+            cols = None
+        # Strings are counted on dictionary indices and never leave Arrow
+        if include != "number":
+            string_counts = {
+                col: arrow.category_counts(table.column(col))
+                for col in arrow.string_columns(table)
+            }
+        df = arrow.pandas_frame(table, arrow.numeric_columns(table))
+    elif sample is not None:
+        df, population = draw_sample(
+            df, sample, stratify=stratify, random_state=random_state
+        )
+        timer.lap("sampling", shape=(population, df.shape[1]))
     if not isinstance(df, pd.DataFrame):
         raise TypeError("The df parameter must be a pandas dataframe")
 
@@ -451,26 +712,102 @@ def plot_basic_distributions(
         raise KeyError("""
             The include parameter must be None, 'number' or 'string'
             """)
+    _check_precision(precision)
+
+    timer.lap("validation", shape=df_data.shape)
+
+    def chart_title(col):
+        if sample is None:
+            return alt.Undefined
+        return _sampled_title(col, len(df_data), population, "proportion")
 
     # Second filter: select types to include
+    df_data_number = df_data.select_dtypes(include="number")
+    df_data_string = df_data.select_dtypes(include="object")
+    if include == "number":
+        df_data_string = df_data_string.iloc[:, :0]
+    elif include == "string":
+        df_data_number = df_data_number.iloc[:, :0]
+
+    frame_key = cache_key(df)
+    for col in df_data_number.columns:
+        if col not in value_ranges:
+            value_ranges[col] = _value_range(df, frame_key, col)
+    distinct_counts = {
+        col: _distinct_count(df, frame_key, col)
+        for col in df_data_string.columns
+    }
+    timer.lap("aggregation", shape=df_data.shape)
+
     if include == "number" or include is None:
 
-        df_data_number = df_data.select_dtypes(include="number")
         for col in df_data_number.columns.tolist():
+            # Fix the bins to the stored or computed value range so Vega
+            # skips computing the extent
+            low, high = value_ranges[col]
+            if precision == "float32":
+                dict_plots[col] = _binned_histogram(
+                    df_data_number[col].to_numpy(), low, high, col,
+                    chart_title(col)
+                )
+                continue
+            extent = [low, high] if low < high else alt.Undefined
             dict_plots[col] = (
-                alt.Chart(df_data_number)
+                alt.Chart(df_data_number, title=chart_title(col))
                 .mark_bar()
-                .encode(alt.X(col, bin=alt.Bin(maxbins=50)), y="count()")
+                .encode(
+                    alt.X(col, bin=alt.Bin(maxbins=50, extent=extent)),
+                    y="count()"
+                )
             )
 
     if include == "string" or include is None:
 
-        df_data_string = df_data.select_dtypes(include="object")
         for col in df_data_string.columns.tolist():
+            distinct_count = distinct_counts[col]
+            if distinct_count <= max_categories:
+                dict_plots[col] = (
+                    alt.Chart(df_data_string, title=chart_title(col))
+                    .mark_bar()
+                    .encode(x=alt.X("count()"), y=alt.Y(col, sort="-x"))
+                )
+                continue
+
+            warnings.warn(
+                "Column {0} has about {1} distinct values, only the {2} "
+                "most frequent are plotted".format(
+                    col, distinct_count, max_categories
+                )
+            )
+            dict_plots[col] = (
+                alt.Chart(df_data_string, title=chart_title(col))
+                .transform_aggregate(count="count()", groupby=[col])
+                .transform_window(
+                    rank="row_number()",
+                    sort=[alt.SortField("count", order="descending")],
+                )
+                .transform_filter(alt.datum.rank <= max_categories)
+                .mark_bar()
+                .encode(x=alt.X("count:Q"), y=alt.Y(col, sort="-x"))
+            )
+
+        for col, counts in string_counts.items():
+            if len(counts) > max_categories:
+                warnings.warn(
+                    "Column {0} has {1} distinct values, only the {2} "
+                    "most frequent are plotted".format(
+                        col, len(counts), max_categories
+                    )
+                )
+            counts_df = (
+                counts.head(max_categories)
+                .rename_axis(col)
+                .reset_index(name="count")
+            )
             dict_plots[col] = (
-                alt.Chart(df_data_string)
+                alt.Chart(counts_df, title=chart_title(col))
                 .mark_bar()
-                .encode(x=alt.X("count()"), y=alt.Y(col, sort="-x"))
+                .encode(x=alt.X("count:Q"), y=alt.Y(col, sort="-x"))
             )
 
     if len(dict_plots) == 0:
@@ -480,4 +817,616 @@ def plot_basic_distributions(
         Please ensure you specifiy the correct parameters for cols and include
         """)
 
+    timer.lap("chart", shape=(df_data.shape[0], len(dict_plots)))
     return dict_plots
+
+
+def missing_patterns(
+    df,
+    cols=None,
+    top_n=10,
+    chunk_size=100_000,
+    max_patterns=100_000,
+):
+    """Takes a dataframe and returns the most frequent combinations of
+    columns that are missing together in a row.
+
+    Each row's missing-value mask is packed into bits with np.packbits and
+    the packed bytes are counted in a hash table, one chunk of rows at a
+    time, so memory is bounded by `chunk_size` and `max_patterns` rather
+    than by the number of rows.
+
+    Parameters
+    -----------
+    df: pd.DataFrame, pyarrow.Table, polars.DataFrame or path
+        Dataframe whose rows are scanned. An iterable of dataframe chunks,
+        such as pd.read_csv(..., chunksize=...), and Parquet or Feather
+        paths are streamed.
+    cols: list, optional
+        List of columns to check for missing values.
+        By default, None (all columns).
+    top_n : integer, optional
+        The number of patterns to return. By default, 10.
+    chunk_size : integer, optional
+        The number of rows packed at once. By default, 100,000.
+    max_patterns : integer, optional
+        The number of distinct patterns kept in memory. When a scan finds
+        more, the rarest are pruned (Misra-Gries), the returned row counts
+        become lower bounds and a warning gives their maximum error.
+        By default, 100,000.
+
+    Returns
+    -------
+    patterns : pandas.DataFrame
+        One row per pattern, most frequent first, with the columns
+        "missing" (tuple of the missing column names), "missing_columns"
+        (their number), "rows" and "share" (of all scanned rows).
+
+    Examples
+    -------
+    >>> example_df = pd.DataFrame({'num_legs': [2, np.nan, 8, np.nan],
+                                   'num_wings': [2, np.nan, 0, 0]})
+    >>> missing_patterns(example_df)
+    """
+    timer = stage_timer("missing_patterns", df)
+    _, patterns = _missing_pattern_counts(
+        df, cols, top_n, chunk_size, max_patterns, timer
+    )
+    return patterns
+
+
+def plot_missing_patterns(
+    df,
+    cols=None,
+    top_n=10,
+    chunk_size=100_000,
+    max_patterns=100_000,
+):
+    """Takes a dataframe and returns a heatmap of the most frequent
+    combinations of missing columns next to their row counts.
+
+    Parameters
+    -----------
+    df: pd.DataFrame, pyarrow.Table, polars.DataFrame or path
+        Dataframe whose rows are scanned, see `missing_patterns`.
+    cols: list, optional
+        List of columns to check for missing values.
+        By default, None (all columns).
+    top_n : integer, optional
+        The number of patterns to plot. By default, 10.
+    chunk_size : integer, optional
+        The number of rows packed at once. By default, 100,000.
+    max_patterns : integer, optional
+        The number of distinct patterns kept in memory. By default, 100,000.
+
+    Returns
+    -------
+    plot : altair.HConcatChart object
+        One row per pattern, most frequent first: the columns it misses and
+        the share of rows that have it.
+
+    Examples
+    -------
+    >>> example_df = pd.DataFrame({'num_legs': [2, np.nan, 8, np.nan],
+                                   'num_wings': [2, np.nan, 0, 0]})
+    >>> plot_missing_patterns(example_df)
+    """
+    import altair as alt
+
+    timer = stage_timer("plot_missing_patterns", df)
+    columns, patterns = _missing_pattern_counts(
+        df, cols, top_n, chunk_size, max_patterns, timer
+    )
+    patterns["pattern"] = [
+        "#{0}".format(rank) for rank in range(1, len(patterns) + 1)
+    ]
+    cells = pd.DataFrame(
+        {
+            "pattern": np.repeat(patterns["pattern"].to_numpy(),
+                                 len(columns)),
+            "column": np.tile(np.asarray(columns, dtype=object),
+                              len(patterns)),
+        }
+    )
+    cells["missing"] = [
+        column in missing
+        for missing in patterns["missing"] for column in columns
+    ]
+
+    order = patterns["pattern"].tolist()
+    heatmap = (
+        alt.Chart(cells, title="Missing value patterns")
+        .mark_rect(stroke="white")
+        .encode(
+            x=alt.X("column:N", sort=None, title=""),
+            y=alt.Y("pattern:N", sort=order, title=""),
+            color=alt.Color(
+                "missing:N", scale=alt.Scale(domain=[False, True],
+                                             range=["#d9d9d9", "#b2182b"])
+            ),
+        )
+    )
+    bars = (
+        alt.Chart(patterns.drop(columns="missing"))
+        .mark_bar()
+        .encode(
+            x=alt.X("share:Q", axis=alt.Axis(format="%"), title="Rows"),
+            y=alt.Y("pattern:N", sort=order, axis=None),
+            tooltip=["rows", alt.Tooltip("share:Q", format=".2%"),
+                     "missing_columns"],
+        )
+        .properties(width=120)
+    )
+    plot = alt.hconcat(heatmap, bars, spacing=4)
+    timer.lap("chart", shape=cells.shape)
+    return plot
+
+
+def _sampled_title(text, n, population, statistic):
+    """Builds a chart title whose subtitle reports the sample size and the
+    95% sampling error."""
+    import altair as alt
+
+    error = sampling_error(n, population, statistic)
+    if statistic == "proportion":
+        error = "{0:.1%} of rows per bar".format(error)
+    else:
+        error = "{0:.3f} on each correlation".format(error)
+    subtitle = "Sample of {0:,} / {1:,} rows, \u00b1{2} (95%)".format(
+        n, population, error
+    )
+    return alt.TitleParams(text, subtitle=subtitle)
+
+
+def _check_precision(precision):
+    precisions = ["float64", "float32"]
+    if precision not in precisions:
+        raise ValueError(
+            "Can only use these precisions: {0} got precision = {1}".format(
+                precisions, precision
+            )
+        )
+
+
+def _correlation(df, cols, method, precision):
+    """Returns the correlation matrix of `cols`, in float32 blocks when
+    asked and supported."""
+    float32 = precision == "float32" and (
+        method == "pearson"
+        or (method == "spearman"
+            and not any(df[col].hasnans for col in cols))
+    )
+    if not float32:
+        return df[cols].corr(method=method)
+    return pd.DataFrame(
+        kernels.correlation([df[col].to_numpy() for col in cols], method),
+        index=cols, columns=cols,
+    )
+
+
+def _prune_correlations(corr, top_k, threshold):
+    """Keeps the variables whose strongest absolute correlation to another
+    variable is at least `threshold`, then the `top_k` strongest of them,
+    in their original order."""
+    if top_k is None and threshold is None:
+        return corr
+    strength = corr.abs().where(~np.eye(len(corr), dtype=bool)).max()
+    if threshold is not None:
+        strength = strength[strength >= threshold]
+    if top_k is not None:
+        strength = strength.sort_values(ascending=False, kind="mergesort")
+        strength = strength.iloc[:top_k]
+    keep = [col for col in corr.index if col in strength.index]
+    if len(keep) < 2:
+        warnings.warn("Fewer than 2 variables are left to plot")
+    return corr.loc[keep, keep]
+
+
+def _cluster_order(corr):
+    """Returns the leaf order of the average-linkage hierarchical clustering
+    of the variables on the distance 1 - |correlation|."""
+    distance = 1 - np.abs(corr)
+    distance[np.isnan(distance)] = 1.0
+    np.fill_diagonal(distance, np.inf)
+    sizes = np.ones(len(corr))
+    members = [[i] for i in range(len(corr))]
+    for _ in range(len(corr) - 1):
+        a, b = sorted(np.unravel_index(np.argmin(distance), distance.shape))
+        # Lance-Williams update: the average distance of the merged cluster
+        merged = (
+            (sizes[a] * distance[a] + sizes[b] * distance[b])
+            / (sizes[a] + sizes[b])
+        )
+        distance[a, :] = distance[:, a] = merged
+        distance[a, a] = np.inf
+        distance[b, :] = distance[:, b] = np.inf
+        sizes[a] += sizes[b]
+        members[a] += members[b]
+    return members[0] if members else []
+
+
+def _binned_histogram(values, low, high, col, title):
+    """Returns a bar chart of `values` binned in float32 over the bins
+    Vega-Lite picks for the extent [low, high]."""
+    import altair as alt
+
+    if np.isnan(low):
+        bins_df = pd.DataFrame({"bin_start": [], "bin_end": [], "count": []})
+    else:
+        edges = kernels.bin_edges(low, high)
+        bins_df = pd.DataFrame(
+            {
+                "bin_start": edges[:-1],
+                "bin_end": edges[1:],
+                "count": kernels.histogram(values, edges),
+            }
+        )
+    return (
+        alt.Chart(bins_df, title=title)
+        .mark_bar()
+        .encode(
+            alt.X("bin_start:Q", bin="binned", title=col),
+            x2="bin_end:Q",
+            y=alt.Y("count:Q", title="Count of Records"),
+        )
+    )
+
+
+def _dtype_columns(df, frame_key, include=None, exclude=None):
+    """Returns the labels of the columns picked by `select_dtypes`."""
+    return cached(
+        df, ("columns", include, exclude),
+        lambda: list(
+            df.select_dtypes(include=include, exclude=exclude).columns
+        ),
+        frame_key,
+    )
+
+
+def _null_counts(df, frame_key, axis):
+    """Returns the number of missing values per column (axis=0) or per row
+    (axis=1), sharing one null mask between both."""
+    def count():
+        null_mask = cached(df, "null_mask", df.isnull, frame_key)
+        return null_mask.sum(axis=axis)
+    return cached(df, ("null_counts", axis), count, frame_key)
+
+
+def _value_range(df, frame_key, col):
+    """Returns the smallest and largest non-missing values of a numeric
+    column, NaN when it has none."""
+    return cached(
+        df, ("range", col), lambda: (df[col].min(), df[col].max()), frame_key
+    )
+
+
+def _distinct_count(df, frame_key, col):
+    """Returns the approximate number of distinct values of one column,
+    without building the quantile sketch."""
+    return cached(
+        df, ("distinct", col),
+        lambda: HyperLogLog().update(df[col].dropna().to_numpy())
+        .cardinality(),
+        frame_key,
+    )
+
+
+def _part_bounds(n_rows, parts):
+    """Returns the inclusive (start, stop) row labels of the parts filled by
+    divide_and_fill. Consecutive parts share their boundary row, which is
+    filled by the first part and then counts as observed in the next."""
+    spacing = n_rows / (parts + 1)
+    index = np.arange(0, n_rows + spacing, spacing, dtype=int)
+    return list(zip(index[:-1], index[1:]))
+
+
+def _impute(part, missing_values, strategy, fill_value):
+    """Fills the missing values of every column of `part` with a statistic
+    of its observed values, like sklearn's SimpleImputer."""
+    if missing_values is None or (
+        isinstance(missing_values, float) and np.isnan(missing_values)
+    ):
+        missing = part.isna()
+    else:
+        missing = part.eq(missing_values)
+    observed = part.mask(missing)
+
+    filled = part.copy()
+    for col in part.columns:
+        numeric = pd.api.types.is_numeric_dtype(part[col].dtype)
+        if strategy == "constant":
+            if fill_value is not None:
+                statistic = fill_value
+            else:
+                statistic = 0 if numeric else "missing_value"
+        elif strategy in ("mean", "median"):
+            if not numeric:
+                raise ValueError(
+                    "Cannot use {0} strategy with non-numeric data".format(
+                        strategy
+                    )
+                )
+            statistic = getattr(observed[col], strategy)()
+        else:
+            # mode() is sorted, so ties resolve to the smallest value
+            modes = observed[col].mode()
+            statistic = modes.iloc[0] if len(modes) else np.nan
+
+        if missing[col].any():
+            filled[col] = part[col].mask(missing[col], statistic)
+    return filled
+
+
+def _intro_metrics(df, timer):
+    """Returns the plot_intro metrics of a pandas DataFrame."""
+    frame_key = cache_key(df)
+    sum_missing_columns = _null_counts(df, frame_key, axis=0)
+    num_of_all_missing_columns = sum(sum_missing_columns)
+
+    sum_missing_rows = _null_counts(df, frame_key, axis=1)
+    num_complete_rows = df.shape[0] - sum(sum_missing_rows)
+    timer.lap("null_scan")
+
+    # Approximate cardinality of every column in one pass
+    num_distinct_values = sum(
+        _distinct_count(df, frame_key, col)
+        for col in df.columns
+    )
+
+    return {
+        "rows": df.shape[0],
+        "columns": df.shape[1],
+        "numeric_columns": len(
+            _dtype_columns(df, frame_key, include="number")
+        ),
+        "all_missing_columns": num_of_all_missing_columns,
+        "total_missing_values": sum_missing_columns.sum(),
+        "complete_rows": num_complete_rows,
+        "total_observations": df.shape[0] * df.shape[1],
+        "memory_usage": cached(
+            df, "memory_usage",
+            lambda: df.memory_usage(deep=True).sum(), frame_key
+        ),
+        "distinct_values": num_distinct_values,
+    }
+
+
+def _missing_pattern_counts(df, cols, top_n, chunk_size, max_patterns,
+                            timer):
+    """Returns the checked columns and the top_n missing value patterns."""
+    for name, value in (("top_n", top_n), ("chunk_size", chunk_size),
+                        ("max_patterns", max_patterns)):
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(
+                "Can only use positive integer {0}.".format(name)
+            )
+    if max_patterns < top_n:
+        raise ValueError("max_patterns must be at least top_n.")
+
+    columns, masks = _missing_masks(df, cols, chunk_size)
+    if not columns:
+        raise ValueError("Can only find patterns of at least one column.")
+    timer.lap("validation")
+
+    counts = {}
+    n_rows = 0
+    max_error = 0
+    width = (len(columns) + 7) // 8
+    for mask in masks:
+        n_rows += len(mask)
+        packed = np.ascontiguousarray(np.packbits(mask, axis=1))
+        rows = packed.view(np.dtype((np.void, width))).ravel()
+        chunk_patterns, chunk_counts = np.unique(rows, return_counts=True)
+        for pattern, count in zip(chunk_patterns, chunk_counts.tolist()):
+            key = pattern.tobytes()
+            counts[key] = counts.get(key, 0) + count
+        if len(counts) > max_patterns:
+            max_error += _prune_patterns(counts, max_patterns)
+    timer.lap("null_scan", shape=(n_rows, len(columns)))
+
+    top = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    top = top[:top_n]
+    flags = np.unpackbits(
+        np.frombuffer(b"".join(key for key, _ in top), dtype=np.uint8)
+        .reshape(len(top), width),
+        axis=1, count=len(columns),
+    ).astype(bool)
+    if max_error:
+        warnings.warn(
+            "Found more than {0} missing value patterns: row counts are "
+            "lower bounds, at most {1} below the exact counts".format(
+                max_patterns, max_error
+            )
+        )
+    patterns = pd.DataFrame(
+        {
+            "missing": [
+                tuple(col for col, flag in zip(columns, row) if flag)
+                for row in flags
+            ],
+            "missing_columns": flags.sum(axis=1),
+            "rows": [count for _, count in top],
+        }
+    )
+    patterns["share"] = patterns["rows"] / max(n_rows, 1)
+    timer.lap("aggregation", shape=patterns.shape)
+    return columns, patterns
+
+
+def _missing_masks(df, cols, chunk_size):
+    """Returns the checked columns and an iterator over the boolean
+    missing-value masks of chunks of at most `chunk_size` rows."""
+    if arrow.is_path(df) or arrow.is_arrow_like(df):
+        if arrow.is_path(df):
+            names = arrow.file_schema(df).names
+        else:
+            names = arrow.to_arrow(df).column_names
+        columns = list(names) if cols is None else list(cols)
+        missing_cols = [col for col in columns if col not in names]
+        if missing_cols:
+            raise KeyError(
+                "Columns {0} are not in the dataframe".format(missing_cols)
+            )
+        batches = arrow.iter_batches(df, columns, chunk_size)
+        return columns, (arrow.missing_matrix(batch) for batch in batches)
+
+    if isinstance(df, pd.DataFrame):
+        chunks = iter([df])
+    elif hasattr(df, "__iter__") and not isinstance(df, (str, dict)):
+        chunks = iter(df)
+    else:
+        raise TypeError(
+            "The input data must be a pandas DataFrame or chunks of one"
+        )
+    first = next(chunks, None)
+    if first is None:
+        return [] if cols is None else list(cols), iter([])
+    columns = list(first.columns) if cols is None else list(cols)
+
+    def masks():
+        for chunk in itertools.chain([first], chunks):
+            if not isinstance(chunk, pd.DataFrame):
+                raise TypeError("Every chunk must be a pandas DataFrame")
+            missing_cols = [col for col in columns
+                            if col not in chunk.columns]
+            if missing_cols:
+                raise KeyError(
+                    "Columns {0} are not in the dataframe".format(
+                        missing_cols
+                    )
+                )
+            positions = chunk.columns.get_indexer(columns)
+            for start in range(0, len(chunk), chunk_size):
+                yield (
+                    chunk.iloc[start: start + chunk_size, positions]
+                    .isnull()
+                    .to_numpy()
+                )
+    return columns, masks()
+
+
+def _prune_patterns(counts, max_patterns):
+    """Prunes `counts` to at most `max_patterns` patterns the Misra-Gries
+    way: every count is lowered by the count of the most frequent pattern
+    that does not fit. Returns that decrement, the added maximum error."""
+    decrement = sorted(counts.values(), reverse=True)[max_patterns]
+    for key, count in list(counts.items()):
+        if count <= decrement:
+            del counts[key]
+        else:
+            counts[key] = count - decrement
+    return decrement
+
+
+def _fill_to_parquet(
+    source, cols, missing_values, strategy, fill_value, random, parts, sink
+):
+    """Fills the parts of divide_and_fill one at a time and appends the
+    filled rows to the Parquet file `sink`. `source` is a pandas DataFrame,
+    a pyarrow.Table or a ParquetFile. Returns the number of rows.
+
+    Part starts never decrease, so rows before the current part's start
+    are final and written out; the shared boundary row stays held until
+    the next part has used it as an observed value.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    is_frame = isinstance(source, pd.DataFrame)
+    n_rows = len(source) if is_frame else arrow.row_count(source)
+    permutation = np.random.permutation(n_rows) if random else None
+
+    def read(start, stop):
+        # Rows are labelled by position, like the in-memory filled_df
+        if permutation is not None:
+            positions = permutation[start:stop]
+        else:
+            positions = np.arange(start, stop)
+        if is_frame:
+            rows = source.iloc[positions]
+        else:
+            rows = arrow.read_rows(source, positions).to_pandas()
+        rows = rows.reset_index(drop=True)
+        rows.index = pd.RangeIndex(start, stop)
+        return rows
+
+    held = read(0, 0)
+    writer = pq.ParquetWriter(sink, _sink_schema(held, cols))
+
+    def write(rows):
+        if len(rows):
+            writer.write_table(pa.Table.from_pandas(
+                rows, schema=writer.schema, preserve_index=False
+            ))
+
+    next_row = 0
+    try:
+        for start, stop in _part_bounds(n_rows, parts):
+            write(held.loc[:start - 1])
+            read_stop = max(next_row, min(stop + 1, n_rows))
+            held = pd.concat([held.loc[start:], read(next_row, read_stop)])
+            next_row = read_stop
+            held.loc[start: stop, cols] = _impute(
+                held.loc[start: stop, cols],
+                missing_values,
+                strategy,
+                fill_value
+            )
+        write(held)
+        write(read(next_row, n_rows))
+    finally:
+        writer.close()
+    return n_rows
+
+
+def _sink_schema(empty_df, cols):
+    """Returns the Parquet schema of the divide_and_fill sink from the
+    dtypes of the empty frame `empty_df`, fixed before any part is filled.
+
+    Filling integer columns can give floats, and missing values of an
+    integer Arrow column only show up as NaN in some parts, so the integer
+    `cols` are written as float64. Object columns are written as strings,
+    as the first rows of a column may all be missing.
+    """
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(empty_df, preserve_index=False)
+    for i, field in enumerate(schema):
+        if field.name in cols and pa.types.is_integer(field.type):
+            schema = schema.set(i, field.with_type(pa.float64()))
+        elif pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+
+def _divide_and_fill_arrow(
+    data, cols, missing_values, strategy, fill_value, random, parts, verbose
+):
+    """Runs divide_and_fill on an Arrow or Polars input. Only the filled
+    columns go through pandas; the others keep their Arrow buffers."""
+    import pyarrow as pa
+
+    table = arrow.to_arrow(data)
+    if cols is None:
+        cols = arrow.numeric_columns(table)
+    if not isinstance(random, bool):
+        raise Exception("The input random must be True or False")
+    if random:
+        table = table.take(np.random.permutation(table.num_rows))
+
+    projected = []
+    if isinstance(cols, list):
+        projected = [
+            col for col in dict.fromkeys(cols)
+            if isinstance(col, str) and col in table.column_names
+        ]
+    filled_df = divide_and_fill(
+        arrow.pandas_frame(table, projected), cols, missing_values, strategy,
+        fill_value, False, parts, verbose
+    )
+    for col in projected:
+        table = table.set_column(
+            table.column_names.index(col), col,
+            pa.Array.from_pandas(filled_df[col])
+        )
+    return arrow.from_arrow(table, data)
@@ -0,0 +1,137 @@
+"""Reduced-precision numeric kernels behind ``precision="float32"``.
+
+Values are centered in float64 and converted to float32 one block of rows
+at a time, so no full-size float64 copy of the data is made. Every block
+is reduced in float32 and the per-block results are added up in float64
+(blocked summation). The rounding error then grows with the block size
+rather than with the number of rows.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+BLOCK_ROWS = 4096
+
+
+def correlation(columns, method="pearson", block_rows=BLOCK_ROWS):
+    """Returns the pairwise correlation matrix of equal-length 1-d arrays,
+    like ``pandas.DataFrame.corr``: a pair of columns only uses the rows
+    where both are present.
+
+    Parameters
+    -----------
+    columns : list of numpy.ndarray
+        The numeric columns, in any integer or float dtype.
+    method : string, optional
+        "pearson" or "spearman". Spearman correlates average ranks, which
+        equals pandas when no value is missing. By default, "pearson".
+    block_rows : integer, optional
+        The number of rows reduced at once in float32.
+
+    Returns
+    -------
+    corr : numpy.ndarray
+        The k x k correlation matrix, in float64.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(
+            "Can only use float32 precision with pearson or spearman"
+        )
+    if method == "spearman":
+        columns = [
+            pd.Series(column).rank().to_numpy(np.float32)
+            for column in columns
+        ]
+
+    k = len(columns)
+    n_rows = len(columns[0]) if k else 0
+    shift = [_rough_mean(column) for column in columns]
+    cross = np.zeros((k, k))
+    sums = np.zeros((k, k))
+    squares = np.zeros((k, k))
+    counts = np.zeros((k, k))
+    block = np.empty((block_rows, k), dtype=np.float32)
+    for start in range(0, n_rows, block_rows):
+        rows = min(block_rows, n_rows - start)
+        values = block[:rows]
+        # Centering in float64 before the cast keeps large-magnitude values
+        # such as epoch seconds exact and the float32 sums well-conditioned
+        for j, column in enumerate(columns):
+            values[:, j] = column[start: start + rows] - shift[j]
+        present = ~np.isnan(values)
+        if present.all():
+            cross += values.T @ values
+            sums += values.sum(axis=0, dtype=np.float64)[:, np.newaxis]
+            squares += (values * values).sum(
+                axis=0, dtype=np.float64)[:, np.newaxis]
+            counts += rows
+        else:
+            values[~present] = 0
+            weights = present.astype(np.float32)
+            cross += values.T @ values
+            sums += values.T @ weights
+            squares += (values * values).T @ weights
+            counts += weights.T @ weights
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = cross - sums * sums.T / counts
+        variance = squares - sums * sums / counts
+        corr = covariance / np.sqrt(variance * variance.T)
+        corr[counts < 2] = np.nan
+    diagonal = np.diag(variance) > 0
+    corr[np.diag_indices(k)] = np.where(diagonal, 1.0, np.nan)
+    return np.clip(corr, -1, 1)
+
+
+def bin_edges(low, high, maxbins=50):
+    """Returns the bin edges Vega-Lite picks for `alt.Bin(maxbins=maxbins,
+    extent=[low, high])`: a nice step (1, 2 or 5 times a power of ten)
+    giving at most `maxbins` bins over the extent."""
+    if not low < high:
+        return np.array([low - 0.5, low + 0.5])
+    span = high - low
+    level = math.ceil(math.log10(maxbins))
+    step = 10.0 ** (math.floor(math.log10(span) + 0.5) - level)
+    while math.ceil(span / step) > maxbins:
+        step *= 10
+    for divide in (5, 2):
+        if span / (step / divide) <= maxbins:
+            step /= divide
+
+    precision = 0 if step >= 1 else int(-math.log10(step)) + 1
+    eps = 10.0 ** (-precision - 1)
+    start = math.floor(low / step + eps) * step
+    if low < start:
+        start -= step
+    stop = math.ceil(high / step) * step
+    n_bins = max(int(round((stop - start) / step)), 1)
+    return start + step * np.arange(n_bins + 1)
+
+
+def histogram(values, edges, block_rows=65_536):
+    """Returns the number of finite `values` in each bin of the evenly
+    spaced `edges`, binning in float32. The last bin includes its upper
+    edge and values outside the edges are not counted."""
+    n_bins = len(edges) - 1
+    scale = np.float32(n_bins / (edges[-1] - edges[0]))
+    counts = np.zeros(n_bins, dtype=np.int64)
+    for start in range(0, len(values), block_rows):
+        # Shift to the first edge before the cast, as in `correlation`
+        block = np.asarray(values[start: start + block_rows]) - edges[0]
+        block = block.astype(np.float32, copy=False)
+        block = block[np.isfinite(block)]
+        index = np.floor(block * scale)
+        index[index == n_bins] = n_bins - 1
+        index = index[(index >= 0) & (index < n_bins)].astype(np.intp)
+        counts += np.bincount(index, minlength=n_bins)
+    return counts
+
+
+def _rough_mean(column, size=65_536):
+    """Returns the mean of an evenly strided subsample of at most `size`
+    values, in float64, used to center the data."""
+    step = max(len(column) // size, 1)
+    subsample = np.asarray(column[::step], dtype=np.float64)
+    subsample = subsample[np.isfinite(subsample)]
+    return subsample.mean() if len(subsample) else 0.0
@@ -0,0 +1,245 @@
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict, namedtuple
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+
+
+StageEvent = namedtuple(
+    "StageEvent",
+    ["function", "stage", "wall_time", "cpu_time", "rows", "columns",
+     "bytes_allocated"],
+)
+StageEvent.__doc__ = """Timing of one stage of an instaeda function call.
+
+wall_time and cpu_time are in seconds. bytes_allocated is the peak memory
+allocated during the stage (the net allocation on Python 3.8), or None when
+tracemalloc is not tracing.
+"""
+
+_hooks = []
+_local = threading.local()
+
+
+def add_hook(callback):
+    """Registers `callback`, called with a StageEvent after every stage of
+    every instaeda function, and returns it.
+
+    Examples
+    -------
+    >>> events = []
+    >>> add_hook(events.append)
+    >>> instaeda.plot_corr(penguin_df)
+    >>> remove_hook(events.append)
+    """
+    if not callable(callback):
+        raise TypeError("The hook must be callable")
+    _hooks.append(callback)
+    return callback
+
+
+def remove_hook(callback):
+    """Unregisters a callback added with `add_hook`."""
+    _hooks.remove(callback)
+
+
+@contextmanager
+def hook(callback):
+    """Registers `callback` for the duration of a with block."""
+    add_hook(callback)
+    try:
+        yield callback
+    finally:
+        remove_hook(callback)
+
+
+class StageProfile:
+    """Hook aggregating StageEvents into a per-stage breakdown.
+
+    Examples
+    -------
+    >>> with profile() as stages:
+            instaeda.divide_and_fill(df, parts=8)
+    >>> stages.summary()
+    """
+
+    def __init__(self):
+        self._totals = OrderedDict()
+
+    def __call__(self, event):
+        key = (event.function, event.stage)
+        totals = self._totals.setdefault(
+            key, {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0, "rows": 0,
+                  "bytes_allocated": None}
+        )
+        totals["calls"] += 1
+        totals["wall_time"] += event.wall_time
+        totals["cpu_time"] += event.cpu_time
+        totals["rows"] += event.rows or 0
+        if event.bytes_allocated is not None:
+            totals["bytes_allocated"] = (
+                (totals["bytes_allocated"] or 0) + event.bytes_allocated
+            )
+
+    def summary(self):
+        """Returns the totals per (function, stage) as a list of dicts, in
+        the order the stages first ran."""
+        summary = []
+        for (function, stage), totals in self._totals.items():
+            function_time = sum(
+                other["wall_time"]
+                for (other_function, _), other in self._totals.items()
+                if other_function == function
+            )
+            row = {"function": function, "stage": stage}
+            row.update(totals)
+            row["share"] = (
+                totals["wall_time"] / function_time if function_time else 0.0
+            )
+            summary.append(row)
+        return summary
+
+    def report(self):
+        """Returns the breakdown as a printable table."""
+        lines = ["{0:<26} {1:<12} {2:>6} {3:>10} {4:>10} {5:>7} {6:>12}"
+                 .format("function", "stage", "calls", "wall s", "cpu s",
+                         "share", "allocated")]
+        for row in self.summary():
+            allocated = row["bytes_allocated"]
+            lines.append(
+                "{0:<26} {1:<12} {2:>6} {3:>10.4f} {4:>10.4f} {5:>7.1%} "
+                "{6:>12}".format(
+                    row["function"], row["stage"], row["calls"],
+                    row["wall_time"], row["cpu_time"], row["share"],
+                    "-" if allocated is None else "{0:,}".format(allocated),
+                )
+            )
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile(trace_memory=False, print_report=True):
+    """Collects the stages of every instaeda call made in a with block and
+    prints a per-stage breakdown at the end.
+
+    Parameters
+    -----------
+    trace_memory : boolean, optional
+        Start tracemalloc to report bytes allocated per stage. This slows
+        the profiled code down noticeably. By default, False.
+    print_report : boolean, optional
+        Print the breakdown when the block exits. By default, True.
+
+    Returns
+    -------
+    stages : StageProfile
+        The aggregator, also usable after the block.
+
+    Examples
+    -------
+    >>> with profile(trace_memory=True):
+            instaeda.plot_intro(df)
+            instaeda.plot_corr(df, method="spearman")
+    """
+    started = trace_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    stages = StageProfile()
+    try:
+        with hook(stages):
+            yield stages
+    finally:
+        if started:
+            tracemalloc.stop()
+    if print_report:
+        print(stages.report())
+
+
+class CancelToken:
+    """Flag that stops the instaeda calls running under `cancel_scope` at
+    their next stage boundary, where they raise CancelledError."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        if self._event.is_set():
+            raise CancelledError("instaeda call cancelled")
+
+
+@contextmanager
+def cancel_scope(token):
+    """Makes the instaeda calls of the current thread check `token` at
+    every stage boundary for the duration of a with block."""
+    previous = getattr(_local, "token", None)
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
+
+
+def stage_timer(function, data=None):
+    """Returns a timer whose `lap(stage)` emits a StageEvent covering the
+    time since the previous lap. When no hook is registered and no
+    cancel_scope is active a shared no-op timer is returned, so
+    instrumentation costs two attribute checks per call."""
+    token = getattr(_local, "token", None)
+    if token is None:
+        if not _hooks:
+            return _NULL_TIMER
+    else:
+        token.check()
+    return _StageTimer(function, data, token)
+
+
+class _StageTimer:
+    def __init__(self, function, data, token=None):
+        self.function = function
+        self.shape = getattr(data, "shape", (None, None))
+        self._token = token
+        self._start()
+
+    def lap(self, stage, shape=None):
+        rows, columns = self.shape if shape is None else shape
+        bytes_allocated = None
+        if self._memory is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, "reset_peak"):
+                bytes_allocated = max(peak - self._memory, 0)
+            else:
+                bytes_allocated = max(current - self._memory, 0)
+        event = StageEvent(
+            self.function, stage, time.perf_counter() - self._wall,
+            time.process_time() - self._cpu, rows, columns, bytes_allocated,
+        )
+        for callback in list(_hooks):
+            callback(event)
+        if self._token is not None:
+            self._token.check()
+        self._start()
+
+    def _start(self):
+        self._memory = None
+        if tracemalloc.is_tracing():
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            self._memory = tracemalloc.get_traced_memory()[0]
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+
+
+class _NullTimer:
+    def lap(self, stage, shape=None):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
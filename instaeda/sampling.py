@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+
+
+def draw_sample(data, sample, stratify=None, random_state=None):
+    """Takes a dataframe or an iterable of dataframe chunks and returns a
+    uniform random sample of its rows together with the population size.
+
+    Rows are drawn with priority (reservoir) sampling: every row receives a
+    random key and the rows with the smallest keys are kept, so chunks are
+    streamed through a bounded reservoir and never concatenated in full.
+    When `stratify` is given, a reservoir is kept per category and the final
+    sample is allocated proportionally to the category sizes, with at least
+    one row per category whenever `sample` allows it.
+
+    Parameters
+    -----------
+    data: pd.DataFrame or iterable of pd.DataFrame
+        Dataframe, or chunks of a dataframe sharing the same columns.
+    sample : integer
+        The number of rows to draw.
+    stratify : string, optional
+        Column whose categories are sampled proportionally.
+        By default, None (simple random sample).
+    random_state : int or numpy.random.Generator, optional
+        Seed for reproducible samples. By default, None.
+
+    Returns
+    -------
+    (dataframe, population) : (pandas.DataFrame, int)
+        The sampled rows, in their original order, and the number of rows
+        seen in `data`.
+
+    Examples
+    -------
+    >>> chunks = pd.read_csv("large.csv", chunksize=100_000)
+    >>> sample_df, n_rows = draw_sample(chunks, 10_000, random_state=0)
+    """
+    if isinstance(sample, bool) or not isinstance(sample, int) or sample < 1:
+        raise ValueError("Can only use positive integer sample.")
+
+    if isinstance(data, pd.DataFrame):
+        chunks = [data]
+    elif hasattr(data, "__iter__") and not isinstance(data, (str, dict)):
+        chunks = data
+    else:
+        raise TypeError(
+            "The input data must be a pandas DataFrame or chunks of one"
+        )
+
+    rng = np.random.default_rng(random_state)
+    reservoir = None
+    keys = None
+    counts = None
+    population = 0
+
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Every chunk must be a pandas DataFrame")
+        if stratify is not None and stratify not in chunk.columns:
+            raise KeyError(
+                "The stratify column {0} is not in the dataframe".format(
+                    stratify
+                )
+            )
+
+        population += len(chunk)
+        chunk_keys = rng.random(len(chunk))
+        if stratify is not None:
+            chunk_counts = chunk[stratify].value_counts(dropna=False)
+            counts = (
+                chunk_counts if counts is None
+                else counts.add(chunk_counts, fill_value=0)
+            )
+        elif reservoir is not None and len(reservoir) == sample:
+            # A full reservoir only admits rows beating its largest key.
+            admitted = chunk_keys < keys.max()
+            chunk, chunk_keys = chunk[admitted], chunk_keys[admitted]
+
+        if reservoir is None:
+            reservoir, keys = chunk, chunk_keys
+        else:
+            reservoir = pd.concat([reservoir, chunk])
+            keys = np.concatenate([keys, chunk_keys])
+
+        keep = _smallest_keys(keys, _strata(reservoir, stratify), sample)
+        if not keep.all():
+            reservoir, keys = reservoir[keep], keys[keep]
+
+    if reservoir is None:
+        raise ValueError("Cannot sample from empty input")
+
+    if stratify is not None:
+        allocation = _allocate(counts.astype(int), sample)
+        strata = _strata(reservoir, stratify)
+        limit = pd.Series(strata).map(allocation).fillna(0).to_numpy()
+        keep = _smallest_keys(keys, strata, limit)
+        reservoir = reservoir[keep]
+
+    return reservoir, population
+
+
+def sampling_error(n, population, statistic="proportion"):
+    """Returns the half-width of a 95% confidence interval for a statistic
+    estimated from a simple random sample of `n` out of `population` rows.
+
+    Parameters
+    -----------
+    n : integer
+        Sample size.
+    population : integer
+        Number of rows the sample was drawn from.
+    statistic : string, optional
+        One of {'proportion', 'correlation'}. For 'proportion' the worst
+        case p = 0.5 is used; for 'correlation' the Fisher z standard error
+        1 / sqrt(n - 3) of a correlation near zero. By default 'proportion'.
+
+    Returns
+    -------
+    error : float
+        Margin of error, including the finite population correction.
+
+    Examples
+    -------
+    >>> round(sampling_error(10_000, 1_000_000_000), 4)
+    0.0098
+    """
+    if statistic not in ("proportion", "correlation"):
+        raise ValueError(
+            "statistic must be one of ('proportion', 'correlation')"
+        )
+    if n >= population:
+        return 0.0
+
+    fpc = np.sqrt((population - n) / (population - 1))
+    if statistic == "proportion":
+        standard_error = np.sqrt(0.25 / n)
+    else:
+        standard_error = 1 / np.sqrt(max(n - 3, 1))
+    return float(1.96 * standard_error * fpc)
+
+
+def _strata(frame, stratify):
+    if stratify is None:
+        return np.zeros(len(frame), dtype=np.int8)
+    return frame[stratify].to_numpy()
+
+
+def _smallest_keys(keys, strata, limit):
+    """Marks the rows whose key ranks within `limit` inside their stratum."""
+    ranks = (
+        pd.Series(keys)
+        .groupby(strata, dropna=False, sort=False)
+        .rank(method="first")
+        .to_numpy()
+    )
+    return ranks <= limit
+
+
+def _allocate(counts, sample):
+    """Splits `sample` rows proportionally over strata of the given sizes."""
+    sizes = counts.to_numpy()
+    total = sizes.sum()
+    if sample >= total:
+        return counts
+
+    quota = sample * sizes / total
+    allocation = np.floor(quota).astype(int)
+    if sample >= len(sizes):
+        allocation = np.maximum(allocation, 1)
+
+    # Hand out the rounding remainder by largest fractional part, or take
+    # back rows from the largest strata if the one-row minimum overshot.
+    shortfall = sample - allocation.sum()
+    if shortfall > 0:
+        order = np.argsort(-(quota - np.floor(quota)), kind="stable")
+        allocation[order[:shortfall]] += 1
+    while shortfall < 0:
+        largest = np.argmax(allocation)
+        allocation[largest] -= 1
+        shortfall += 1
+
+    return pd.Series(np.minimum(allocation, sizes), index=counts.index)
@@ -0,0 +1,350 @@
+import base64
+
+import numpy as np
+import pandas as pd
+
+
+class TDigest:
+    """Mergeable quantile sketch (t-digest with the arcsine scale function).
+
+    Values are clustered into weighted centroids that are small near the
+    tails and large around the median, so extreme quantiles stay accurate
+    while memory is bounded by roughly `compression / 2` centroids. Two
+    digests built on different chunks merge into the digest of the union.
+
+    Parameters
+    -----------
+    compression : integer, optional
+        Accuracy/size trade-off. Larger values keep more centroids.
+        By default, 200.
+
+    Examples
+    -------
+    >>> digest = TDigest().update(np.random.normal(size=100_000))
+    >>> digest.quantile([0.05, 0.5, 0.95])
+    """
+
+    def __init__(self, compression=200):
+        if not isinstance(compression, int) or compression < 10:
+            raise ValueError("Can only use integer compression >= 10.")
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Adds the non-missing `values` to the digest and returns it."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._absorb(values, np.ones(len(values)))
+        return self
+
+    def merge(self, other):
+        """Merges another digest into this one and returns it."""
+        if other.count == 0:
+            return self
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._absorb(other.means, other.weights)
+        return self
+
+    def quantile(self, q):
+        """Returns the estimated quantile(s) `q` in [0, 1]."""
+        q = np.asarray(q, dtype=float)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("Quantiles must be between 0 and 1.")
+        if self.count == 0:
+            return np.full(q.shape, np.nan)[()]
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return np.interp(
+            q * self.count,
+            np.concatenate([[0], centers, [self.count]]),
+            np.concatenate([[self.min], self.means, [self.max]]),
+        )[()]
+
+    def to_dict(self):
+        """Returns a JSON-serializable representation of the digest."""
+        empty = self.count == 0
+        return {
+            "compression": self.compression,
+            "count": int(self.count),
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+            "means": self.means.tolist(),
+            "weights": self.weights.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuilds a digest from the output of `to_dict`."""
+        digest = cls(state["compression"])
+        digest.count = state["count"]
+        if digest.count:
+            digest.min = float(state["min"])
+            digest.max = float(state["max"])
+        digest.means = np.asarray(state["means"], dtype=float)
+        digest.weights = np.asarray(state["weights"], dtype=float)
+        return digest
+
+    def _absorb(self, means, weights):
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+
+        # Centroids whose left edge falls in the same unit interval of the
+        # scale function k(q) = compression / (2 pi) * asin(2q - 1) merge.
+        self.count = weights.sum()
+        left = (np.cumsum(weights) - weights) / self.count
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * left - 1)
+        groups = np.floor(scale - scale[0]).astype(np.intp)
+        groups = np.unique(groups, return_inverse=True)[1]
+
+        self.weights = np.bincount(groups, weights=weights)
+        self.means = (
+            np.bincount(groups, weights=means * weights) / self.weights
+        )
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch.
+
+    Each value is hashed to 64 bits; the first `precision` bits pick one of
+    2 ** precision registers, which keeps the longest run of leading zeros
+    seen in the remaining bits. The relative standard error is about
+    1.04 / sqrt(2 ** precision), 0.8% at the default precision, for a fixed
+    16 KiB of registers.
+
+    Parameters
+    -----------
+    precision : integer, optional
+        Number of index bits, between 4 and 18. By default, 14.
+
+    Examples
+    -------
+    >>> HyperLogLog().update(np.arange(1_000_000) % 5_000).cardinality()
+    """
+
+    def __init__(self, precision=14):
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise ValueError("Can only use integer precision from 4 to 18.")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Adds the non-missing `values` to the sketch and returns it."""
+        values = pd.Series(np.asarray(values).ravel()).dropna().to_numpy()
+        if len(values) == 0:
+            return self
+        try:
+            hashes = pd.util.hash_array(values)
+        except TypeError:
+            # Unhashable cells such as lists are counted by their text
+            hashes = pd.util.hash_array(
+                pd.Series(values).astype(str).to_numpy()
+            )
+
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        remainder = hashes << np.uint64(self.precision)
+        # The top 53 bits convert to float exactly, so frexp's exponent is
+        # their bit length and the leading zero count follows from it.
+        _, bit_length = np.frexp(
+            (remainder >> np.uint64(11)).astype(np.float64)
+        )
+        rank = np.minimum(54 - bit_length, 65 - self.precision)
+
+        # np.maximum.at is slow, and ranks take few values, so raise the
+        # registers one rank at a time, in increasing order
+        for value in np.flatnonzero(np.bincount(rank)):
+            hit = index[rank == value]
+            self.registers[hit] = np.maximum(self.registers[hit], value)
+        return self
+
+    def merge(self, other):
+        """Merges another sketch of the same precision and returns it."""
+        if other.precision != self.precision:
+            raise ValueError("Can only merge sketches of equal precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def cardinality(self):
+        """Returns the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        powers = np.ldexp(1.0, -self.registers.astype(np.int64))
+        estimate = alpha * m * m / np.sum(powers)
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self):
+        """Returns a JSON-serializable representation of the sketch."""
+        return {
+            "precision": self.precision,
+            "registers": base64.b64encode(
+                self.registers.tobytes()
+            ).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuilds a sketch from the output of `to_dict`."""
+        sketch = cls(state["precision"])
+        sketch.registers = np.frombuffer(
+            base64.b64decode(state["registers"]), dtype=np.uint8
+        ).copy()
+        return sketch
+
+
+class ColumnSummary:
+    """Streaming summary of one column: row and null counts, a HyperLogLog
+    distinct count and, for numeric columns, a t-digest of the values.
+
+    Summaries of the same column built on different chunks or processes
+    combine with `merge`.
+    """
+
+    def __init__(self, numeric, compression=200, precision=14):
+        self.numeric = numeric
+        self.count = 0
+        self.null_count = 0
+        self.digest = TDigest(compression) if numeric else None
+        self.distinct = HyperLogLog(precision)
+
+    def update(self, series):
+        """Adds a chunk of the column and returns the summary."""
+        values = series.dropna().to_numpy()
+        self.count += len(series)
+        self.null_count += len(series) - len(values)
+        self.distinct.update(values)
+        if self.digest is not None:
+            self.digest.update(values)
+        return self
+
+    def merge(self, other):
+        """Merges the summary of another chunk and returns this one."""
+        self.count += other.count
+        self.null_count += other.null_count
+        self.distinct.merge(other.distinct)
+        if self.digest is not None and other.digest is not None:
+            self.digest.merge(other.digest)
+        return self
+
+    @property
+    def distinct_count(self):
+        """Estimated number of distinct non-missing values."""
+        return self.distinct.cardinality()
+
+    def quantile(self, q):
+        """Returns the estimated quantile(s) `q`, NaN for non-numeric."""
+        if self.digest is None:
+            return np.full(np.shape(q), np.nan)[()]
+        return self.digest.quantile(q)
+
+    def to_dict(self):
+        """Returns a JSON-serializable representation of the summary."""
+        return {
+            "numeric": self.numeric,
+            "count": int(self.count),
+            "null_count": int(self.null_count),
+            "distinct": self.distinct.to_dict(),
+            "digest": None if self.digest is None else self.digest.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuilds a summary from the output of `to_dict`."""
+        summary = cls(state["numeric"])
+        summary.count = state["count"]
+        summary.null_count = state["null_count"]
+        summary.distinct = HyperLogLog.from_dict(state["distinct"])
+        if state["digest"] is not None:
+            summary.digest = TDigest.from_dict(state["digest"])
+        return summary
+
+
+def summarize(data, cols=None, compression=200, precision=14):
+    """Takes a dataframe or an iterable of dataframe chunks and returns
+    per-column quantile and distinct-count sketches built in one pass.
+
+    Parameters
+    -----------
+    data: pd.DataFrame or iterable of pd.DataFrame
+        Dataframe, or chunks of a dataframe sharing the same columns.
+    cols: list, optional
+        List of columns to summarize.
+        By default, None (summarize all columns).
+    compression : integer, optional
+        t-digest compression for numeric columns. By default, 200.
+    precision : integer, optional
+        HyperLogLog precision. By default, 14.
+
+    Returns
+    -------
+    summaries : dict of ColumnSummary using the column name as the key
+        Numeric columns carry a t-digest; every column carries a distinct
+        count. Use `merge_summaries` to combine results of several calls.
+
+    Examples
+    -------
+    >>> summaries = summarize(pd.read_csv("large.csv", chunksize=100_000))
+    >>> summaries["price"].quantile([0.01, 0.99])
+    >>> summaries["city"].distinct_count
+    """
+    if isinstance(data, pd.DataFrame):
+        chunks = [data]
+    elif hasattr(data, "__iter__") and not isinstance(data, (str, dict)):
+        chunks = data
+    else:
+        raise TypeError(
+            "The input data must be a pandas DataFrame or chunks of one"
+        )
+
+    summaries = None
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Every chunk must be a pandas DataFrame")
+        if cols is not None:
+            chunk = chunk[cols]
+        if summaries is None:
+            numeric = set(chunk.select_dtypes(include="number").columns)
+            summaries = {
+                col: ColumnSummary(col in numeric, compression, precision)
+                for col in chunk.columns
+            }
+        for col, summary in summaries.items():
+            summary.update(chunk[col])
+
+    return {} if summaries is None else summaries
+
+
+def merge_summaries(*summaries):
+    """Merges the outputs of several `summarize` calls, column by column.
+
+    Parameters
+    -----------
+    *summaries : dict of ColumnSummary
+        Results of `summarize` on disjoint chunks, e.g. from worker
+        processes or rebuilt with `ColumnSummary.from_dict`.
+
+    Returns
+    -------
+    summaries : dict of ColumnSummary
+        Summaries of the union of the chunks. The inputs are not modified.
+    """
+    merged = {}
+    for summary in summaries:
+        for col, column_summary in summary.items():
+            if col in merged:
+                merged[col].merge(column_summary)
+            else:
+                merged[col] = ColumnSummary.from_dict(column_summary.to_dict())
+    return merged
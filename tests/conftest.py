@@ -0,0 +1,8 @@
+import pytest
+from palmerpenguins import load_penguins
+
+
+@pytest.fixture
+def input_dataframe():
+    penguin_df = load_penguins()
+    return penguin_df
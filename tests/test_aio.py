@@ -0,0 +1,136 @@
+from instaeda import instaeda
+from instaeda import aio
+from instaeda.profiling import stage_timer
+import asyncio
+import threading
+import time
+import pytest
+import altair as alt
+import pandas as pd
+
+
+@pytest.fixture(autouse=True)
+def reset_concurrency():
+    concurrency = aio.get_concurrency()
+    yield
+    aio.set_concurrency(concurrency)
+
+
+def test_public_functions(input_dataframe):
+    async def main():
+        return await asyncio.gather(
+            aio.plot_intro(input_dataframe),
+            aio.plot_corr(input_dataframe, method="spearman"),
+            aio.divide_and_fill(input_dataframe, parts=2),
+            aio.plot_basic_distributions(input_dataframe, include="number"),
+            aio.missing_patterns(input_dataframe),
+            aio.plot_missing_patterns(input_dataframe),
+        )
+
+    intro, corr, filled, plots, patterns, missing_plot = asyncio.run(main())
+    assert isinstance(intro, alt.Chart)
+    pd.testing.assert_frame_equal(
+        corr.data, instaeda.plot_corr(input_dataframe,
+                                      method="spearman").data
+    )
+    pd.testing.assert_frame_equal(
+        filled, instaeda.divide_and_fill(input_dataframe, parts=2)
+    )
+    assert len(plots) == 5
+    assert patterns["rows"].sum() == 344
+    assert isinstance(missing_plot, alt.HConcatChart)
+
+    with pytest.raises(KeyError):
+        asyncio.run(aio.plot_corr(input_dataframe, cols=["fake", "year"]))
+
+
+def test_concurrency_limit():
+    lock = threading.Lock()
+    running = [0]
+    most = [0]
+
+    def work():
+        with lock:
+            running[0] += 1
+            most[0] = max(most[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    async def main():
+        await asyncio.gather(*(aio.run(work) for _ in range(6)))
+
+    aio.set_concurrency(2)
+    assert aio.get_concurrency() == 2
+    asyncio.run(main())
+    assert most[0] == 2
+    with pytest.raises(ValueError):
+        aio.set_concurrency(0)
+
+
+def test_event_loop_is_not_blocked():
+    async def main():
+        ticks = 0
+        task = asyncio.ensure_future(aio.run(time.sleep, 0.2))
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks
+
+    assert asyncio.run(main()) > 5
+
+
+def test_cancellation_at_stage_boundary():
+    started = threading.Event()
+    release = threading.Event()
+    stopped = threading.Event()
+    stages = []
+
+    def work():
+        try:
+            timer = stage_timer("work")
+            started.set()
+            release.wait(5)
+            stages.append("first")
+            timer.lap("first")
+            stages.append("second")
+        finally:
+            stopped.set()
+
+    async def main():
+        task = asyncio.ensure_future(aio.run(work))
+        while not started.is_set():
+            await asyncio.sleep(0.005)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+    asyncio.run(main())
+    assert stopped.wait(5)
+    assert stages == ["first"]
+
+
+def test_cancelled_before_start():
+    release = threading.Event()
+    calls = []
+
+    async def main():
+        aio.set_concurrency(1)
+        blocking = asyncio.ensure_future(aio.run(release.wait, 5))
+        queued = asyncio.ensure_future(aio.run(calls.append, "queued"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        await blocking
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+    asyncio.run(main())
+    assert calls == []
+
+
+def test_stage_timer_outside_scope_is_free():
+    # Without hooks or an active scope, calls keep the shared no-op timer
+    assert stage_timer("work") is stage_timer("other")
@@ -0,0 +1,322 @@
+from instaeda import instaeda
+from instaeda import arrow
+import warnings
+import pytest
+import altair as alt
+import numpy as np
+import pandas as pd
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def input_table(input_dataframe):
+    return pa.Table.from_pandas(input_dataframe, preserve_index=False)
+
+
+def test_is_arrow_like(input_dataframe, input_table):
+    assert arrow.is_arrow_like(input_table)
+    assert arrow.is_arrow_like(input_table.to_batches()[0])
+    assert not arrow.is_arrow_like(input_dataframe)
+    assert not arrow.is_arrow_like([input_table])
+
+
+def test_missing_count():
+    column = pa.chunked_array([[1.0, None, np.nan], [2.0, np.nan]])
+    assert arrow.missing_count(column) == 3
+    assert arrow.missing_count(pa.chunked_array([["a", None]])) == 1
+
+
+def test_intro_metrics(input_dataframe, input_table):
+    metrics = arrow.intro_metrics(input_table)
+    expected = instaeda._intro_metrics(
+        input_dataframe, instaeda.stage_timer("plot_intro")
+    )
+    for key in ["rows", "columns", "numeric_columns", "all_missing_columns",
+                "total_missing_values", "complete_rows",
+                "total_observations"]:
+        assert metrics[key] == expected[key]
+    assert metrics["distinct_values"] == sum(
+        input_dataframe[col].nunique() for col in input_dataframe.columns
+    )
+
+
+def test_numeric_view():
+    values = np.arange(10, dtype=np.float64)
+    column = pa.chunked_array([pa.array(values)])
+    view = arrow.numeric_view(column)
+    assert view.base is not None and not view.flags.writeable
+    np.testing.assert_array_equal(view, values)
+
+    column = pa.chunked_array([[1, None], [3]])
+    np.testing.assert_array_equal(arrow.numeric_view(column),
+                                  [1.0, np.nan, 3.0])
+
+
+def test_pandas_frame():
+    table = pa.table({"x": np.arange(10.0), "n": np.arange(10),
+                      "s": list("abcdefghij")})
+    df = arrow.pandas_frame(table, ["x", "n", "s"])
+    for col in ["x", "n"]:
+        assert np.shares_memory(df[col].to_numpy(),
+                                table.column(col).chunk(0).to_numpy())
+    assert list(df["s"]) == list("abcdefghij")
+
+
+def test_category_counts():
+    column = pa.chunked_array([["a", "b", None], ["b", "c", "b"]])
+    counts = arrow.category_counts(column)
+    assert counts.to_dict() == {"b": 3, "a": 1, "c": 1}
+    assert list(counts.index[:1]) == ["b"]
+    assert arrow.category_counts(pa.chunked_array([], pa.string())).empty
+
+
+def test_sample_table(input_table):
+    sampled, population = arrow.sample_table(input_table, 50,
+                                             stratify="species",
+                                             random_state=0)
+    assert population == 344
+    assert sampled.num_rows == 50
+    assert sampled.column_names == input_table.column_names
+    with pytest.raises(KeyError):
+        arrow.sample_table(input_table, 50, stratify="fake")
+
+
+def test_plot_intro(input_table):
+    plot = instaeda.plot_intro(input_table, plot_title="Arrow")
+    assert isinstance(plot, alt.Chart)
+    assert plot.title == "Arrow"
+
+
+def test_plot_corr(input_dataframe, input_table):
+    plot = instaeda.plot_corr(input_table)
+    expected = instaeda.plot_corr(input_dataframe)
+    assert isinstance(plot, alt.LayerChart)
+    pd.testing.assert_frame_equal(plot.data, expected.data)
+
+    plot = instaeda.plot_corr(
+        input_table, cols=["bill_length_mm", "bill_depth_mm", "species"]
+    )
+    assert plot.data.shape[0] == 4
+    with pytest.raises(KeyError):
+        instaeda.plot_corr(input_table, cols=["bill_length_mm", "fake"])
+    plot = instaeda.plot_corr(input_table, sample=100, random_state=0)
+    assert "Sample of 100" in plot.layer[0].title.subtitle
+
+
+def test_plot_basic_distributions(input_dataframe, input_table):
+    plots = instaeda.plot_basic_distributions(input_table)
+    expected = instaeda.plot_basic_distributions(input_dataframe)
+    assert list(plots) == list(expected)
+    assert plots["species"].data["count"].sum() == 344
+    assert instaeda.plot_basic_distributions(input_table,
+                                             include="number").keys() == {
+        "bill_length_mm", "bill_depth_mm", "flipper_length_mm",
+        "body_mass_g", "year"}
+    with pytest.raises(KeyError):
+        instaeda.plot_basic_distributions(input_table, cols=["fake"])
+    with pytest.warns(UserWarning):
+        instaeda.plot_basic_distributions(input_table, cols=["island"],
+                                          max_categories=2)
+
+
+def test_divide_and_fill(input_dataframe, input_table):
+    filled = instaeda.divide_and_fill(input_table, parts=3)
+    expected = instaeda.divide_and_fill(input_dataframe, parts=3)
+    assert isinstance(filled, pa.Table)
+    assert filled.column_names == input_table.column_names
+    pd.testing.assert_frame_equal(filled.to_pandas(), expected,
+                                  check_dtype=False)
+
+    filled = instaeda.divide_and_fill(input_table, cols=["sex"],
+                                      strategy="most_frequent")
+    assert filled.column("sex").null_count == 0
+    assert filled.column("bill_length_mm").null_count == 2
+
+    filled = instaeda.divide_and_fill(input_table, random=True)
+    assert filled.num_rows == 344
+    with pytest.raises(Exception):
+        instaeda.divide_and_fill(input_table, random="yes")
+
+
+def test_polars_input(input_dataframe):
+    pl = pytest.importorskip("polars")
+    polars_df = pl.from_pandas(input_dataframe)
+    assert isinstance(instaeda.plot_intro(polars_df), alt.Chart)
+    assert isinstance(instaeda.plot_corr(polars_df), alt.LayerChart)
+    assert "species" in instaeda.plot_basic_distributions(polars_df)
+    filled = instaeda.divide_and_fill(polars_df)
+    assert isinstance(filled, pl.DataFrame)
+    assert filled["bill_length_mm"].null_count() == 0
+
+
+@pytest.fixture
+def parquet_path(input_table, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "penguins.parquet"
+    pq.write_table(input_table, path, row_group_size=100)
+    return path
+
+
+@pytest.fixture
+def feather_path(input_table, tmp_path):
+    feather = pytest.importorskip("pyarrow.feather")
+    path = tmp_path / "penguins.feather"
+    feather.write_feather(input_table, path, compression="uncompressed")
+    return path
+
+
+def test_is_path(parquet_path, feather_path):
+    assert arrow.is_path(parquet_path)
+    assert arrow.is_path(str(feather_path))
+    assert not arrow.is_path("penguins.csv")
+    assert not arrow.is_path(["penguins.parquet"])
+
+
+def test_read_file(parquet_path, feather_path):
+    for path in (parquet_path, feather_path):
+        table, selected = arrow.read_file(
+            path, ["species", "bill_length_mm", "year"], include="number",
+            extra="species"
+        )
+        assert selected == ["bill_length_mm", "year"]
+        assert table.column_names == ["bill_length_mm", "year", "species"]
+        with pytest.raises(KeyError):
+            arrow.read_file(path, ["fake"])
+
+
+def test_value_ranges(input_dataframe, parquet_path, feather_path,
+                      tmp_path):
+    body_mass = input_dataframe["body_mass_g"]
+    assert arrow.value_ranges(
+        parquet_path, ["year", "species", "body_mass_g"]
+    ) == {"year": (2007, 2009),
+          "body_mass_g": (body_mass.min(), body_mass.max())}
+    assert arrow.value_ranges(feather_path, ["year"]) == {}
+
+    # NaN is not a Parquet null, so float columns are read to count it
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "nan.parquet"
+    pq.write_table(pa.table({"x": pa.array([1.0, np.nan, None],
+                                           from_pandas=False)}), path)
+    assert arrow.value_ranges(path, ["x"]) == {"x": (1.0, 1.0)}
+    assert arrow.file_intro_metrics(path)["total_missing_values"] == 2
+
+
+def test_file_intro_metrics(input_table, parquet_path, feather_path):
+    expected = arrow.intro_metrics(input_table)
+    for path in (parquet_path, feather_path):
+        metrics = arrow.file_intro_metrics(path)
+        for key in ["rows", "columns", "numeric_columns",
+                    "total_missing_values", "complete_rows",
+                    "distinct_values"]:
+            assert metrics[key] == expected[key]
+    assert isinstance(instaeda.plot_intro(parquet_path), alt.Chart)
+
+
+def test_path_input(input_dataframe, parquet_path, feather_path):
+    expected = instaeda.plot_corr(input_dataframe)
+    for path in (parquet_path, feather_path):
+        plot = instaeda.plot_corr(path)
+        pd.testing.assert_frame_equal(plot.data, expected.data)
+        with pytest.raises(KeyError):
+            instaeda.plot_corr(path, cols=["bill_length_mm", "fake"])
+
+        plots = instaeda.plot_basic_distributions(
+            path, cols=["species", "body_mass_g"], sample=100,
+            stratify="island", random_state=0
+        )
+        assert list(plots) == ["body_mass_g", "species"]
+
+        filled = instaeda.divide_and_fill(path)
+        assert isinstance(filled, pa.Table)
+        assert filled.column("bill_length_mm").null_count == 0
+
+    plots = instaeda.plot_basic_distributions(parquet_path,
+                                              include="number")
+    assert plots["body_mass_g"].encoding.x.bin.extent == [2700, 6300]
+
+
+def test_missing_patterns(input_dataframe, input_table, parquet_path,
+                          feather_path):
+    expected = instaeda.missing_patterns(input_dataframe)
+    for data in (input_table, parquet_path, feather_path):
+        pd.testing.assert_frame_equal(
+            instaeda.missing_patterns(data, chunk_size=50), expected
+        )
+    with pytest.raises(KeyError):
+        instaeda.missing_patterns(parquet_path, cols=["fake"])
+
+
+def test_divide_and_fill_sink(input_dataframe, input_table, parquet_path,
+                              tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    sink = tmp_path / "filled.parquet"
+    for parts in (1, 3, 50):
+        for cols, strategy in ((None, "mean"), (["sex"], "most_frequent")):
+            assert instaeda.divide_and_fill(
+                input_dataframe, cols=cols, strategy=strategy, parts=parts,
+                sink=sink
+            ) == sink
+            expected = instaeda.divide_and_fill(
+                input_dataframe, cols=cols, strategy=strategy, parts=parts
+            )
+            # Filled integer columns are written as float64
+            if cols is None:
+                expected["year"] = expected["year"].astype(float)
+            pd.testing.assert_frame_equal(pq.read_table(sink).to_pandas(),
+                                          expected)
+        # One row group per part, plus the rows after the last part
+        assert pq.ParquetFile(sink).metadata.num_row_groups <= parts + 2
+
+    # A Parquet path is read part by part rather than as a whole table
+    monkeypatch.setattr(arrow, "read_table", None)
+    for data in (input_table, parquet_path):
+        instaeda.divide_and_fill(data, parts=4, sink=sink)
+        pd.testing.assert_frame_equal(
+            pq.read_table(sink).to_pandas(),
+            instaeda.divide_and_fill(input_dataframe, parts=4),
+            check_dtype=False,
+        )
+
+    # Shuffled parts of a Parquet input decode every row group
+    for data in (input_dataframe, parquet_path):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            instaeda.divide_and_fill(data, random=True, sink=sink)
+        assert any(
+            "decoded" in str(warning.message) for warning in caught
+        ) == (data is parquet_path)
+        filled = pq.read_table(sink).to_pandas()
+        assert len(filled) == 344
+        assert filled["bill_length_mm"].notna().all()
+        assert sorted(filled["species"]) == sorted(input_dataframe["species"])
+
+    # Nulls of an integer column only appear after the first part, and the
+    # first rows of a string column are all missing
+    table = pa.table({
+        "count": pa.array([1, 2, 3, 4, 5, None, 7, 8, None]),
+        "label": pa.array([None, None, None, "a", "b", None, "c", "d", "e"]),
+    })
+    instaeda.divide_and_fill(table, cols=["count"], parts=2, sink=sink)
+    filled = pq.read_table(sink)
+    assert filled.schema.field("count").type == pa.float64()
+    assert filled.column("count").null_count == 0
+    assert filled.column("label").to_pylist() == table.column(
+        "label").to_pylist()
+    instaeda.divide_and_fill(table.to_pandas(), cols=["count"], parts=2,
+                             sink=sink)
+    filled = pq.read_table(sink)
+    assert filled.schema.field("label").type == pa.string()
+    assert filled.column("label").null_count == 4
+
+    # Both paths split parts by row position, not by index label
+    labelled_df = input_dataframe.set_index(input_dataframe.index + 100)
+    instaeda.divide_and_fill(labelled_df, parts=3, sink=sink)
+    expected = instaeda.divide_and_fill(labelled_df, parts=3)
+    expected["year"] = expected["year"].astype(float)
+    pd.testing.assert_frame_equal(pq.read_table(sink).to_pandas(),
+                                  expected.reset_index(drop=True))
+
+    with pytest.raises(ValueError):
+        instaeda.divide_and_fill(input_dataframe, parts=0, sink=sink)
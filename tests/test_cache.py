@@ -0,0 +1,116 @@
+from instaeda import instaeda
+from instaeda import cache
+import pytest
+import numpy as np
+import pandas as pd
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear_cache()
+    yield
+    cache.set_cache_limit(0)
+    cache.clear_cache()
+
+
+def test_fingerprint(input_dataframe):
+    key = cache.fingerprint(input_dataframe)
+    assert cache.fingerprint(input_dataframe) == key
+    # A copy holds new buffers, a changed sampled row changes the hash
+    assert cache.fingerprint(input_dataframe.copy()) != key
+    changed_df = input_dataframe.copy()
+    changed_key = cache.fingerprint(changed_df)
+    changed_df.iloc[0, 2] = 0.0
+    assert cache.fingerprint(changed_df) != changed_key
+    assert cache.fingerprint(pd.DataFrame()) == cache.fingerprint(
+        pd.DataFrame())
+
+
+def test_computation_cache():
+    df = pd.DataFrame({"a": np.arange(1000)})
+    lru = cache.ComputationCache(max_bytes=20_000)
+    calls = []
+
+    def compute(size):
+        calls.append(size)
+        return np.zeros(size, dtype=np.uint8)
+
+    lru.get_or_compute(df, "first", lambda: compute(8_000))
+    lru.get_or_compute(df, "first", lambda: compute(8_000))
+    assert calls == [8_000]
+    assert lru.info().hits == 1
+    assert lru.info().misses == 1
+
+    # The least recently used entry goes first once the cap is exceeded
+    lru.get_or_compute(df, "second", lambda: compute(8_000))
+    lru.get_or_compute(df, "first", lambda: compute(8_000))
+    lru.get_or_compute(df, "third", lambda: compute(8_000))
+    info = lru.info()
+    assert info.evictions == 1
+    assert info.entries == 2
+    assert info.bytes <= info.max_bytes
+    lru.get_or_compute(df, "second", lambda: compute(8_000))
+    assert calls == [8_000] * 4
+
+    # Artifacts larger than the cap are computed but never stored
+    lru.get_or_compute(df, "huge", lambda: compute(50_000))
+    assert lru.info().entries == 2
+
+    lru.resize(0)
+    assert lru.info().entries == 0
+    with pytest.raises(ValueError):
+        cache.ComputationCache(max_bytes=-1)
+
+
+def test_shared_cache(input_dataframe):
+    with cache.session():
+        instaeda.plot_intro(input_dataframe)
+        # Only the null mask is shared by the column and row counts
+        assert cache.cache_info().hits == 1
+
+        # plot_basic_distributions adds the value ranges of numeric columns
+        instaeda.plot_basic_distributions(input_dataframe)
+        misses = cache.cache_info().misses
+
+        # Later calls on the same frame reuse the derived artifacts
+        instaeda.plot_intro(input_dataframe)
+        instaeda.plot_basic_distributions(input_dataframe)
+        instaeda.plot_corr(input_dataframe)
+        instaeda.plot_corr(input_dataframe)
+        instaeda.divide_and_fill(input_dataframe)
+        info = cache.cache_info()
+        assert info.hits >= 8
+        assert info.misses <= misses + 2
+        assert info.max_bytes == cache.DEFAULT_SESSION_BYTES
+
+    info = cache.cache_info()
+    assert info.entries == 0 and info.max_bytes == 0
+    instaeda.plot_intro(input_dataframe)
+    assert cache.cache_info().entries == 0
+
+
+def test_in_place_edit():
+    # None of the edited rows is sampled by the fingerprint
+    df = pd.DataFrame({"a": np.arange(100_000.0), "b": np.ones(100_000)})
+    key = cache.fingerprint(df)
+    metrics = instaeda._intro_metrics(df, instaeda.stage_timer("plot_intro"))
+    assert metrics["total_missing_values"] == 0
+
+    df.iloc[1:1000, 0] = np.nan
+    assert cache.fingerprint(df) == key
+    metrics = instaeda._intro_metrics(df, instaeda.stage_timer("plot_intro"))
+    assert metrics["total_missing_values"] == 999
+
+
+def test_no_fingerprint_without_cache(input_dataframe, monkeypatch):
+    def fail(df):
+        raise AssertionError("fingerprint computed with the cache off")
+
+    monkeypatch.setattr(cache, "fingerprint", fail)
+    instaeda.plot_intro(input_dataframe)
+    instaeda.plot_corr(input_dataframe)
+    instaeda.plot_basic_distributions(input_dataframe)
+    instaeda.divide_and_fill(input_dataframe)
+    with pytest.raises(AssertionError):
+        with cache.session():
+            instaeda.plot_intro(input_dataframe)
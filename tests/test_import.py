@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+# Import time budget for the module holding the public functions once
+# numpy and pandas are loaded, in microseconds. It measures about 30 ms;
+# an eager import of altair alone would add over 100 ms.
+IMPORT_BUDGET_US = 100_000
+
+
+def import_times(code):
+    """Runs `code` under `python -X importtime` and returns the cumulative
+    import time per module and the code's standard output."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times, result.stdout
+
+
+def test_package_import_is_lazy():
+    times, _ = import_times("import instaeda")
+    assert "pandas" not in times
+    assert "altair" not in times
+
+
+def test_fill_only_import():
+    code = """
+import sys
+import numpy as np
+import pandas as pd
+from instaeda import divide_and_fill
+divide_and_fill(pd.DataFrame({"a": [1.0, None, 3.0]}))
+print(",".join(name for name in ("altair", "sklearn", "jsonschema")
+               if name in sys.modules))
+"""
+    times, loaded = import_times(code)
+    assert loaded.strip() == ""
+    assert times["instaeda.instaeda"] < IMPORT_BUDGET_US
+
+
+def test_charts_load_altair():
+    code = """
+import sys
+from instaeda import plot_intro
+import pandas as pd
+plot_intro(pd.DataFrame({"a": [1.0, None, 3.0]}))
+print("altair" in sys.modules)
+"""
+    _, loaded = import_times(code)
+    assert loaded.strip() == "True"
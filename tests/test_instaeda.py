@@ -1,6 +1,5 @@
 from instaeda import instaeda
 import pytest
-from palmerpenguins import load_penguins
 import pandas as pd
 import altair as alt
 import numpy as np
@@ -9,12 +8,6 @@ from pandas._testing import assert_frame_equal
 # import warnings
 
 
-@pytest.fixture
-def input_dataframe():
-    penguin_df = load_penguins()
-    return penguin_df
-
-
 def test_input_df(input_dataframe):
     rows_in_df = len(input_dataframe)
     assert rows_in_df == 344
@@ -170,6 +163,13 @@ def test_divide_and_fill(input_dataframe):
         instaeda.divide_and_fill(not_na_dataframe, verbose="string part")
     assert 'Can only use integer for verbose' in str(exc_info.value)
 
+    # parts are split by row position, whatever the index labels
+    labelled_df = pd.DataFrame({"x": [np.nan, 1, 2, np.nan, 10, np.nan]},
+                               index=range(10, 16))
+    filled = instaeda.divide_and_fill(labelled_df, parts=1)
+    assert list(filled.index) == list(range(10, 16))
+    assert filled["x"].tolist() == [1.5, 1.0, 2.0, 1.5, 10.0, 5.75]
+
 
 def test_plot_corr(input_dataframe):
     assert (
@@ -311,3 +311,105 @@ def test_plot_intro(input_dataframe):
         'the result plot should have correctly set the title to meow'
     test_plot = instaeda.plot_intro(input_dataframe, plot_title="")
     assert "Memory Usage" in test_plot.title, 'Fail using an empty plot_title'
+
+
+def test_missing_patterns(input_dataframe):
+    patterns = instaeda.missing_patterns(input_dataframe)
+    assert list(patterns.columns) == ["missing", "missing_columns", "rows",
+                                      "share"]
+    assert patterns["missing"].tolist() == [
+        (),
+        ("sex",),
+        ("bill_length_mm", "bill_depth_mm", "flipper_length_mm",
+         "body_mass_g", "sex"),
+    ]
+    assert patterns["rows"].tolist() == [333, 9, 2]
+    assert patterns["missing_columns"].tolist() == [0, 1, 5]
+    assert patterns["share"].sum() == pytest.approx(1.0)
+
+    # Chunked inputs and small chunks give the same counts
+    chunks = [input_dataframe.iloc[:100], input_dataframe.iloc[100:]]
+    pd.testing.assert_frame_equal(
+        instaeda.missing_patterns(chunks, chunk_size=7), patterns
+    )
+    patterns = instaeda.missing_patterns(input_dataframe, cols=["sex"],
+                                         top_n=1)
+    assert patterns["missing"].tolist() == [()]
+    assert patterns["rows"].tolist() == [333]
+
+    # Over 8 columns the patterns span several bytes
+    wide_df = pd.DataFrame(np.ones((20, 13)),
+                           columns=["c{0}".format(i) for i in range(13)])
+    wide_df.iloc[:5, 12] = np.nan
+    wide_df.iloc[:2, [0, 9]] = np.nan
+    patterns = instaeda.missing_patterns(wide_df)
+    assert patterns["missing"].tolist() == [(), ("c12",),
+                                            ("c0", "c9", "c12")]
+    assert patterns["rows"].tolist() == [15, 3, 2]
+
+    with pytest.warns(UserWarning):
+        patterns = instaeda.missing_patterns(input_dataframe, top_n=2,
+                                             chunk_size=7, max_patterns=2)
+    assert (patterns["rows"] <= [333, 9]).all()
+    assert (patterns["rows"] >= [333 - 9, 0]).all()
+
+    with pytest.raises(KeyError):
+        instaeda.missing_patterns(input_dataframe, cols=["fake"])
+    with pytest.raises(ValueError):
+        instaeda.missing_patterns(input_dataframe, top_n=0)
+    with pytest.raises(ValueError):
+        instaeda.missing_patterns(input_dataframe, top_n=5, max_patterns=2)
+    with pytest.raises(TypeError):
+        instaeda.missing_patterns(12345)
+
+
+def test_plot_missing_patterns(input_dataframe):
+    plot = instaeda.plot_missing_patterns(input_dataframe)
+    assert isinstance(plot, alt.HConcatChart)
+    heatmap, bars = plot.hconcat
+    assert heatmap.data.shape == (3 * input_dataframe.shape[1], 3)
+    assert heatmap.data["missing"].sum() == 6
+    assert bars.data["pattern"].tolist() == ["#1", "#2", "#3"]
+
+
+def test_plot_corr_large_heatmap_options(input_dataframe):
+    # Two groups of correlated variables, interleaved in column order
+    rng = np.random.default_rng(0)
+    first, second = rng.normal(size=(2, 500))
+    df = pd.DataFrame({
+        "a1": first + rng.normal(scale=0.1, size=500),
+        "b1": second + rng.normal(scale=0.4, size=500),
+        "a2": first + rng.normal(scale=0.2, size=500),
+        "b2": second + rng.normal(scale=0.5, size=500),
+        "a3": first + rng.normal(scale=0.3, size=500),
+        "noise": rng.normal(size=500),
+    })
+    plot = instaeda.plot_corr(df, order="cluster")
+    order = plot.layer[0].encoding.x.sort
+    assert order == plot.layer[0].encoding.y.sort
+    assert sorted(order) == sorted(df.columns)
+    groups = "".join(col[0] for col in order if col != "noise")
+    assert groups in ("aaabb", "bbaaa")
+
+    plot = instaeda.plot_corr(df, top_k=3)
+    assert set(plot.data["variable_1"]) == {"a1", "a2", "a3"}
+
+    plot = instaeda.plot_corr(df, threshold=0.5)
+    assert set(plot.data["variable_1"]) == {"a1", "a2", "a3", "b1", "b2"}
+    assert (plot.data["corr"].abs() >= 0.5).all()
+
+    plot = instaeda.plot_corr(df, max_text_cells=35)
+    assert isinstance(plot, alt.Chart)
+    assert isinstance(instaeda.plot_corr(df, max_text_cells=None),
+                      alt.LayerChart)
+
+    with pytest.warns(UserWarning):
+        instaeda.plot_corr(df, threshold=1.0)
+    with pytest.raises(ValueError):
+        instaeda.plot_corr(df, order="alphabetical")
+    with pytest.raises(ValueError):
+        instaeda.plot_corr(df, top_k=1)
+    with pytest.raises(ValueError):
+        instaeda.plot_corr(df, threshold=2)
+    with pytest.raises(ValueError):
+        instaeda.plot_corr(df, max_text_cells=-1)
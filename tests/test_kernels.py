@@ -0,0 +1,113 @@
+from instaeda import instaeda
+from instaeda import kernels
+import pytest
+import numpy as np
+import pandas as pd
+
+# plot_corr shows correlations rounded to 4 decimals, so float32 results
+# must stay within this of the float64 ones
+CORR_TOLERANCE = 1e-4
+
+
+@pytest.fixture
+def large_dataframe():
+    rng = np.random.default_rng(0)
+    n_rows = 200_000
+    base = rng.normal(size=n_rows)
+    df = pd.DataFrame({
+        # A large offset makes naive float32 sums of squares cancel
+        "offset": 1e4 + base + rng.normal(scale=0.5, size=n_rows),
+        "scaled": 1e-3 * base,
+        "skewed": rng.lognormal(size=n_rows),
+        "counts": rng.poisson(3, size=n_rows),
+        "single": rng.normal(size=n_rows).astype(np.float32),
+        # Epoch-like integers lose their variation when cast to float32
+        "epoch": 1_600_000_000 + (100 * base).astype(np.int64),
+    })
+    df.loc[rng.choice(n_rows, 1000, replace=False), "skewed"] = np.nan
+    return df
+
+
+def test_correlation_error_bound(input_dataframe, large_dataframe):
+    for df in (input_dataframe.select_dtypes("number"), large_dataframe):
+        corr = kernels.correlation(
+            [df[col].to_numpy() for col in df.columns]
+        )
+        expected = df.corr().to_numpy()
+        assert np.abs(corr - expected).max() <= CORR_TOLERANCE
+
+    df = large_dataframe.drop(columns="skewed")
+    corr = kernels.correlation([df[col].to_numpy() for col in df.columns],
+                               method="spearman")
+    expected = df.corr(method="spearman").to_numpy()
+    assert np.abs(corr - expected).max() <= CORR_TOLERANCE
+
+
+def test_correlation_edge_cases():
+    corr = kernels.correlation([
+        np.array([1.0, 2.0, 3.0, np.nan]),
+        np.array([5.0, 5.0, 5.0, 5.0]),
+        np.array([np.nan, np.nan, np.nan, 1.0]),
+    ])
+    assert corr[0, 0] == 1.0
+    assert np.isnan(corr[1, 1]) and np.isnan(corr[0, 1])
+    assert np.isnan(corr[0, 2])
+    with pytest.raises(ValueError):
+        kernels.correlation([np.arange(3), np.arange(3)], method="kendall")
+
+
+def test_bin_edges():
+    np.testing.assert_allclose(kernels.bin_edges(2700, 6300),
+                               np.arange(2700, 6301, 100))
+    edges = kernels.bin_edges(32.1, 59.6)
+    assert edges[0] == 32 and edges[-1] >= 59.6
+    assert len(edges) - 1 <= 50
+    np.testing.assert_allclose(np.diff(edges), 1)
+    np.testing.assert_allclose(kernels.bin_edges(3, 3), [2.5, 3.5])
+
+
+def test_histogram_error_bound(large_dataframe):
+    for col in large_dataframe.columns:
+        values = large_dataframe[col].to_numpy()
+        finite = values[np.isfinite(values)].astype(np.float64)
+        edges = kernels.bin_edges(finite.min(), finite.max())
+        counts = kernels.histogram(values, edges, block_rows=10_000)
+        expected, _ = np.histogram(finite, edges)
+        assert counts.sum() == len(finite)
+        # Only values within float32 rounding of an edge may move, each to
+        # a neighbouring bin
+        width = edges[1] - edges[0]
+        near_edge = np.abs(
+            (finite - edges[0]) / width
+            - np.round((finite - edges[0]) / width)
+        ) <= 1e-6 * (np.abs(finite).max() / width + 1)
+        assert np.abs(counts - expected).sum() <= 2 * near_edge.sum()
+
+
+def test_plot_corr_float32(input_dataframe, large_dataframe):
+    for df in (input_dataframe, large_dataframe):
+        for method in ("pearson", "spearman", "kendall"):
+            if method == "kendall" and len(df) > 1000:
+                continue
+            plot = instaeda.plot_corr(df, method=method, precision="float32")
+            expected = instaeda.plot_corr(df, method=method)
+            np.testing.assert_allclose(plot.data["corr"],
+                                       expected.data["corr"],
+                                       atol=CORR_TOLERANCE + 1e-4)
+    with pytest.raises(ValueError):
+        instaeda.plot_corr(input_dataframe, precision="float16")
+
+
+def test_plot_basic_distributions_float32(input_dataframe):
+    plots = instaeda.plot_basic_distributions(input_dataframe,
+                                              precision="float32")
+    assert plots.keys() == instaeda.plot_basic_distributions(
+        input_dataframe).keys()
+    histogram = plots["body_mass_g"]
+    assert histogram.encoding.x.bin == "binned"
+    assert list(histogram.data.columns) == ["bin_start", "bin_end", "count"]
+    assert histogram.data["count"].sum() == 342
+    assert histogram.data["bin_start"].iloc[0] == 2700
+    with pytest.raises(ValueError):
+        instaeda.plot_basic_distributions(input_dataframe,
+                                          precision="half")
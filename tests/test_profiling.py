@@ -0,0 +1,63 @@
+from instaeda import instaeda
+from instaeda import profiling
+import pytest
+
+
+def test_hooks(input_dataframe):
+    events = []
+    with profiling.hook(events.append):
+        instaeda.plot_intro(input_dataframe)
+        instaeda.plot_corr(input_dataframe, sample=100, random_state=0)
+        instaeda.divide_and_fill(input_dataframe)
+        instaeda.plot_basic_distributions(input_dataframe)
+
+    stages = [(event.function, event.stage) for event in events]
+    assert stages == [
+        ("plot_intro", "null_scan"),
+        ("plot_intro", "aggregation"),
+        ("plot_intro", "chart"),
+        ("plot_corr", "sampling"),
+        ("plot_corr", "validation"),
+        ("plot_corr", "correlation"),
+        ("plot_corr", "chart"),
+        ("divide_and_fill", "validation"),
+        ("divide_and_fill", "copy"),
+        ("divide_and_fill", "imputation"),
+        ("plot_basic_distributions", "validation"),
+        ("plot_basic_distributions", "aggregation"),
+        ("plot_basic_distributions", "chart"),
+    ]
+    for event in events:
+        assert event.wall_time >= 0
+        assert event.cpu_time >= 0
+        assert event.bytes_allocated is None
+    assert events[0].rows == 344
+    assert events[0].columns == 8
+    assert events[3].rows == 344
+    assert events[5].rows == 100
+    assert events[5].columns == 5
+
+    # Removed hooks see no further events
+    instaeda.plot_intro(input_dataframe)
+    assert len(events) == 13
+    assert profiling.stage_timer("plot_intro") is profiling._NULL_TIMER
+
+    with pytest.raises(TypeError):
+        profiling.add_hook("not callable")
+
+
+def test_profile(input_dataframe, capsys):
+    with profiling.profile(trace_memory=True) as stages:
+        instaeda.divide_and_fill(input_dataframe, parts=4)
+        instaeda.divide_and_fill(input_dataframe, parts=4)
+
+    summary = stages.summary()
+    assert [row["stage"] for row in summary] == ["validation", "copy",
+                                                 "imputation"]
+    assert all(row["calls"] == 2 for row in summary)
+    assert all(row["bytes_allocated"] > 0 for row in summary)
+    assert abs(sum(row["share"] for row in summary) - 1) < 1e-9
+
+    report = capsys.readouterr().out
+    assert "divide_and_fill" in report
+    assert "imputation" in report
@@ -0,0 +1,66 @@
+from instaeda import instaeda
+from instaeda.sampling import draw_sample, sampling_error
+import pytest
+import altair as alt
+import numpy as np
+
+
+def chunked(df, size):
+    for start in range(0, len(df), size):
+        yield df.iloc[start: start + size]
+
+
+def test_draw_sample(input_dataframe):
+    sample_df, population = draw_sample(input_dataframe, 50, random_state=0)
+    assert len(sample_df) == 50
+    assert population == 344
+    assert sample_df.index.is_monotonic_increasing
+
+    # The same seed gives the same sample, chunked or not
+    chunked_df, population = draw_sample(chunked(input_dataframe, 40), 50,
+                                         random_state=0)
+    assert population == 344
+    assert list(chunked_df.index) == list(sample_df.index)
+
+    # Asking for more rows than available returns everything
+    sample_df, population = draw_sample(input_dataframe, 1000)
+    assert len(sample_df) == population == 344
+
+    # Every category, including missing, is represented
+    sample_df, _ = draw_sample(chunked(input_dataframe, 40), 20,
+                               stratify="sex", random_state=1)
+    assert len(sample_df) == 20
+    assert sample_df["sex"].isna().sum() >= 1
+    assert set(sample_df["sex"].dropna()) == {"male", "female"}
+
+    with pytest.raises(ValueError):
+        draw_sample(input_dataframe, 0)
+    with pytest.raises(TypeError):
+        draw_sample(["not", "a", "dataframe"], 10)
+    with pytest.raises(KeyError):
+        draw_sample(input_dataframe, 10, stratify="invalid column name")
+
+
+def test_sampling_error():
+    assert sampling_error(100, 100) == 0.0
+    assert np.isclose(sampling_error(10_000, 10 ** 9), 0.0098, atol=1e-4)
+    assert sampling_error(100, 10 ** 6, "correlation") > \
+        sampling_error(100, 10 ** 6)
+    with pytest.raises(ValueError):
+        sampling_error(100, 1000, statistic="unsupported")
+
+
+def test_sampled_charts(input_dataframe):
+    corr_plot = instaeda.plot_corr(chunked(input_dataframe, 100),
+                                   sample=100, random_state=0)
+    assert isinstance(corr_plot, alt.LayerChart)
+    title = corr_plot.layer[0].title
+    assert "Sample of 100 / 344 rows" in title.subtitle
+
+    dict_plots = instaeda.plot_basic_distributions(input_dataframe,
+                                                   sample=100,
+                                                   stratify="species",
+                                                   random_state=0)
+    assert len(dict_plots.keys()) == 8
+    assert "Sample of 100 / 344 rows" in dict_plots["species"].title.subtitle
+    assert len(dict_plots["species"].data) == 100
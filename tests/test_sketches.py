@@ -0,0 +1,113 @@
+from instaeda import instaeda
+from instaeda.sketches import (TDigest, HyperLogLog, ColumnSummary,
+                               summarize, merge_summaries)
+import json
+import pickle
+import pytest
+import altair as alt
+import numpy as np
+import pandas as pd
+
+
+def test_tdigest():
+    values = np.random.default_rng(0).normal(size=200_000)
+    digest = TDigest().update(values)
+    quantiles = [0.01, 0.25, 0.5, 0.75, 0.99]
+    assert np.allclose(digest.quantile(quantiles),
+                       np.quantile(values, quantiles), atol=0.02)
+    assert digest.quantile(0) == values.min()
+    assert digest.quantile(1) == values.max()
+    assert len(digest.means) <= digest.compression
+
+    # Merging digests of chunks approximates the digest of the whole
+    merged = TDigest()
+    for chunk in np.array_split(values, 10):
+        merged.merge(TDigest().update(chunk))
+    assert merged.count == len(values)
+    assert np.allclose(merged.quantile(quantiles),
+                       np.quantile(values, quantiles), atol=0.02)
+
+    restored = TDigest.from_dict(json.loads(json.dumps(digest.to_dict())))
+    assert np.allclose(restored.quantile(quantiles),
+                       digest.quantile(quantiles))
+    assert np.isnan(TDigest().quantile(0.5))
+
+    with pytest.raises(ValueError):
+        digest.quantile(1.5)
+
+
+def test_hyperloglog():
+    for n in [10, 1000, 100_000]:
+        sketch = HyperLogLog().update(np.arange(n))
+        assert abs(sketch.cardinality() - n) <= 0.03 * n
+
+    strings = np.array(["a", "b", None, "a", np.nan], dtype=object)
+    assert HyperLogLog().update(strings).cardinality() == 2
+
+    # Unhashable cells are counted by their text
+    lists = pd.Series([[1], [2], None, [1]]).to_numpy()
+    assert HyperLogLog().update(lists).cardinality() == 2
+
+    left = HyperLogLog().update(np.arange(0, 60_000))
+    right = HyperLogLog().update(np.arange(40_000, 100_000))
+    assert abs(left.merge(right).cardinality() - 100_000) <= 3000
+
+    restored = HyperLogLog.from_dict(json.loads(json.dumps(left.to_dict())))
+    assert restored.cardinality() == left.cardinality()
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
+
+
+def test_summarize(input_dataframe):
+    summaries = summarize(input_dataframe)
+    assert list(summaries.keys()) == list(input_dataframe.columns)
+    assert summaries["species"].distinct_count == 3
+    assert summaries["species"].digest is None
+    assert np.isnan(summaries["species"].quantile(0.5))
+    assert summaries["sex"].null_count == 11
+    assert summaries["body_mass_g"].quantile(0) == 2700
+
+    chunks = [input_dataframe.iloc[:100], input_dataframe.iloc[100:]]
+    first, second = summarize(chunks[0]), summarize(chunks[1])
+    merged = merge_summaries(first, pickle.loads(pickle.dumps(second)))
+    assert merged["island"].count == 344
+    assert merged["island"].distinct_count == 3
+    assert first["island"].count == 100
+    assert summarize(iter(chunks))["year"].quantile(1) == 2009
+
+    state = json.dumps({col: summary.to_dict()
+                        for col, summary in merged.items()})
+    restored = {col: ColumnSummary.from_dict(summary)
+                for col, summary in json.loads(state).items()}
+    assert restored["bill_depth_mm"].count == 344
+
+    assert summarize([]) == {}
+    with pytest.raises(TypeError):
+        summarize("not a dataframe")
+
+
+def test_sketch_guided_charts(input_dataframe):
+    dict_plots = instaeda.plot_basic_distributions(input_dataframe)
+    assert dict_plots["body_mass_g"].encoding.x.bin.extent == [2700, 6300]
+
+    high_cardinality_df = pd.DataFrame(
+        {"name": ["name_{0}".format(i % 500) for i in range(2000)]}
+    )
+    with pytest.warns(UserWarning):
+        dict_plots = instaeda.plot_basic_distributions(high_cardinality_df,
+                                                       max_categories=20)
+    assert dict_plots["name"].encoding.x["shorthand"] == "count:Q"
+    assert isinstance(dict_plots["name"].to_dict(), dict)
+
+    plot_df = instaeda.plot_intro(input_dataframe).data
+    assert "Distinct Values" in list(plot_df["Metrics"])
+    assert isinstance(instaeda.plot_intro(input_dataframe), alt.Chart)
+
+
+def test_unhashable_column():
+    df = pd.DataFrame({"a": [[1], [2], None], "b": [1.0, None, 3]})
+    assert isinstance(instaeda.plot_intro(df), alt.Chart)
+    assert instaeda.plot_basic_distributions(df).keys() == {"a", "b"}